@@ -2,10 +2,13 @@
 
 import logging
 from pathlib import Path
+from typing import Any
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -37,10 +40,7 @@ class Settings(BaseSettings):
 
     # Logging configuration
     log_level: str = Field(default="INFO", description="Logging level")
-    log_format: str = Field(
-        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        description="Log format string",
-    )
+    log_format: str = Field(default=_DEFAULT_LOG_FORMAT, description="Log format string")
 
     # API configuration
     api_title: str = Field(default="Heare Memory Global Service", description="API title")
@@ -51,7 +51,7 @@ class Settings(BaseSettings):
     api_version: str = Field(default="0.1.0", description="API version")
 
     # CORS configuration
-    cors_origins: list[str] = Field(default=["*"], description="List of origins allowed for CORS")
+    cors_origins: tuple[str, ...] = Field(default=("*",), description="Origins allowed for CORS")
     cors_allow_credentials: bool = Field(
         default=True, description="Allow credentials in CORS requests"
     )
@@ -73,5 +73,36 @@ class Settings(BaseSettings):
         self.memory_root.mkdir(parents=True, exist_ok=True)
 
 
-# Global settings instance
-settings = Settings()
+class _LazySettings:
+    """Proxy that defers building ``Settings`` until an attribute is first read.
+
+    Constructing ``Settings`` reads ``.env`` and validates every field, so doing
+    it at import time taxes every importer, including ones that never touch
+    configuration. The proxy builds the instance on first access and forwards
+    all reads and writes to it afterwards.
+    """
+
+    __slots__ = ("_instance",)
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_instance", None)
+
+    def _load(self) -> Settings:
+        instance = self._instance
+        if instance is None:
+            instance = Settings()
+            object.__setattr__(self, "_instance", instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._load(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(self._load())
+
+
+# Global settings instance, resolved on first attribute access
+settings: Settings = _LazySettings()  # type: ignore[assignment]
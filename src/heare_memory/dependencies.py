@@ -1,32 +1,37 @@
 """FastAPI dependencies for the memory service."""
 
-from fastapi import Depends
+from fastapi import Request
 
+from .config import settings
 from .file_manager import FileManager
 from .git_manager import GitManager
 from .services.memory_service import MemoryService
-from .state import state
 
 
-def get_file_manager() -> FileManager:
-    """Get the FileManager instance."""
-    if state.file_manager is None:
-        state.file_manager = FileManager()
-    return state.file_manager
-
-
-def get_git_manager() -> GitManager:
-    """Get the GitManager instance."""
-    if state.git_manager is None:
-        from .config import settings
-
-        state.git_manager = GitManager(repository_path=settings.memory_root)
-    return state.git_manager
-
-
-def get_memory_service(
-    file_manager: FileManager = Depends(get_file_manager),
-    git_manager: GitManager = Depends(get_git_manager),
-) -> MemoryService:
-    """Get the MemoryService instance."""
-    return MemoryService(file_manager=file_manager, git_manager=git_manager)
+def get_file_manager(request: Request) -> FileManager:
+    """Get the FileManager instance, created on first use if startup did not set one."""
+    app_state = request.app.state
+    file_manager = getattr(app_state, "file_manager", None)
+    if file_manager is None:
+        file_manager = app_state.file_manager = FileManager()
+    return file_manager
+
+
+def get_git_manager(request: Request) -> GitManager:
+    """Get the GitManager instance, created on first use if startup did not set one."""
+    app_state = request.app.state
+    git_manager = getattr(app_state, "git_manager", None)
+    if git_manager is None:
+        git_manager = app_state.git_manager = GitManager(repository_path=settings.memory_root)
+    return git_manager
+
+
+def get_memory_service(request: Request) -> MemoryService:
+    """Get the MemoryService instance, created on first use if startup did not set one."""
+    app_state = request.app.state
+    memory_service = getattr(app_state, "memory_service", None)
+    if memory_service is None:
+        memory_service = app_state.memory_service = MemoryService(
+            file_manager=get_file_manager(request), git_manager=get_git_manager(request)
+        )
+    return memory_service
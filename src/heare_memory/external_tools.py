@@ -1,11 +1,20 @@
 """External tool availability and validation."""
 
+import logging
 import shutil
 import subprocess
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Executable used to query the version of each tool, keyed by ToolCheck.name
+_VERSION_COMMANDS = {"git": "git", "gh": "gh", "ripgrep": "rg", "grep": "grep"}
+
+# Version banners fit on one short line; anything past this is ignored
+_VERSION_OUTPUT_LIMIT = 128
+
+
+@dataclass(frozen=True, slots=True)
 class ToolCheck:
     """Result of checking an external tool."""
 
@@ -16,7 +25,7 @@ class ToolCheck:
     install_suggestion: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolsStatus:
     """Status of all external tools."""
 
@@ -31,13 +40,27 @@ class ExternalToolChecker:
 
     def __init__(self):
         """Initialize the external tool checker."""
+        self._cache: dict[str, ToolCheck] = {}
+        self._versions: dict[str, str | None] = {}
+        self._status: ToolsStatus | None = None
+
+    def invalidate(self) -> None:
+        """Discard cached tool checks so the next call re-probes the system."""
+        self._cache.clear()
+        self._versions.clear()
+        self._status = None
 
     def check_all_tools(self) -> ToolsStatus:
         """Check all required external tools.
 
+        Results are cached on the checker; call ``invalidate()`` to re-probe.
+
         Returns:
             ToolsStatus: Status of all tools
         """
+        if self._status is not None:
+            return self._status
+
         git_check = self.check_git()
         gh_check = self.check_gh_cli()
         search_check = self.check_search_backend()
@@ -45,12 +68,13 @@ class ExternalToolChecker:
         # Git is the only truly required tool
         all_required = git_check.available
 
-        return ToolsStatus(
+        self._status = ToolsStatus(
             git=git_check,
             gh_cli=gh_check,
             search_backend=search_check,
             all_required_available=all_required,
         )
+        return self._status
 
     def check_git(self) -> ToolCheck:
         """Check git availability and functionality.
@@ -58,6 +82,13 @@ class ExternalToolChecker:
         Returns:
             ToolCheck: Git tool status
         """
+        cached = self._cache.get("git")
+        if cached is None:
+            cached = self._cache["git"] = self._probe_git()
+        return cached
+
+    def _probe_git(self) -> ToolCheck:
+        """Probe git, bypassing the cache."""
         if not shutil.which("git"):
             return ToolCheck(
                 name="git",
@@ -66,50 +97,7 @@ class ExternalToolChecker:
                 install_suggestion="Install git: https://git-scm.com/downloads",
             )
 
-        try:
-            # Check git version
-            result = subprocess.run(  # noqa: S603
-                ["git", "--version"],  # noqa: S607
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.returncode != 0:
-                return ToolCheck(
-                    name="git",
-                    available=False,
-                    error_message=f"Git command failed: {result.stderr}",
-                )
-
-            version = result.stdout.strip()
-
-            # Test basic git functionality
-            result = subprocess.run(  # noqa: S603
-                ["git", "config", "--global", "--get", "user.name"],  # noqa: S607
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            return ToolCheck(
-                name="git",
-                available=True,
-                version=version,
-            )
-
-        except subprocess.TimeoutExpired:
-            return ToolCheck(
-                name="git",
-                available=False,
-                error_message="Git command timed out",
-            )
-        except Exception as exc:
-            return ToolCheck(
-                name="git",
-                available=False,
-                error_message=f"Error checking git: {exc}",
-            )
+        return ToolCheck(name="git", available=True)
 
     def check_gh_cli(self) -> ToolCheck:
         """Check GitHub CLI availability.
@@ -117,6 +105,13 @@ class ExternalToolChecker:
         Returns:
             ToolCheck: GitHub CLI tool status
         """
+        cached = self._cache.get("gh")
+        if cached is None:
+            cached = self._cache["gh"] = self._probe_gh_cli()
+        return cached
+
+    def _probe_gh_cli(self) -> ToolCheck:
+        """Probe the GitHub CLI, bypassing the cache."""
         if not shutil.which("gh"):
             return ToolCheck(
                 name="gh",
@@ -125,42 +120,7 @@ class ExternalToolChecker:
                 install_suggestion="Install GitHub CLI: https://cli.github.com/",
             )
 
-        try:
-            # Check gh version
-            result = subprocess.run(  # noqa: S603
-                ["gh", "--version"],  # noqa: S607
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.returncode != 0:
-                return ToolCheck(
-                    name="gh",
-                    available=False,
-                    error_message=f"GitHub CLI command failed: {result.stderr}",
-                )
-
-            version = result.stdout.strip().split("\n")[0]
-
-            return ToolCheck(
-                name="gh",
-                available=True,
-                version=version,
-            )
-
-        except subprocess.TimeoutExpired:
-            return ToolCheck(
-                name="gh",
-                available=False,
-                error_message="GitHub CLI command timed out",
-            )
-        except Exception as exc:
-            return ToolCheck(
-                name="gh",
-                available=False,
-                error_message=f"Error checking GitHub CLI: {exc}",
-            )
+        return ToolCheck(name="gh", available=True)
 
     def check_search_backend(self) -> ToolCheck:
         """Check search backend availability (ripgrep with grep fallback).
@@ -168,47 +128,18 @@ class ExternalToolChecker:
         Returns:
             ToolCheck: Search backend tool status
         """
-        # First try ripgrep
+        cached = self._cache.get("search")
+        if cached is None:
+            cached = self._cache["search"] = self._probe_search_backend()
+        return cached
+
+    def _probe_search_backend(self) -> ToolCheck:
+        """Probe ripgrep, then grep, bypassing the cache."""
         if shutil.which("rg"):
-            try:
-                result = subprocess.run(  # noqa: S603
-                    ["rg", "--version"],  # noqa: S607
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-
-                if result.returncode == 0:
-                    version = result.stdout.strip().split("\n")[0]
-                    return ToolCheck(
-                        name="ripgrep",
-                        available=True,
-                        version=version,
-                    )
-
-            except Exception:  # noqa: S110
-                pass  # Fall through to grep check
-
-        # Fall back to grep
+            return ToolCheck(name="ripgrep", available=True)
+
         if shutil.which("grep"):
-            try:
-                result = subprocess.run(  # noqa: S603
-                    ["grep", "--version"],  # noqa: S607
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-
-                if result.returncode == 0:
-                    version = result.stdout.strip().split("\n")[0]
-                    return ToolCheck(
-                        name="grep",
-                        available=True,
-                        version=version,
-                    )
-
-            except Exception:  # noqa: S110
-                pass
+            return ToolCheck(name="grep", available=True)
 
         return ToolCheck(
             name="search",
@@ -217,9 +148,69 @@ class ExternalToolChecker:
             install_suggestion="Install ripgrep: https://github.com/BurntSushi/ripgrep#installation",
         )
 
+    def get_version(self, check: ToolCheck) -> str | None:
+        """Get the version string of an available tool.
+
+        Availability checks only locate the executable; the version is
+        probed on first request and cached, since it is informational only.
+
+        Args:
+            check: Result of a previous tool check
+
+        Returns:
+            str | None: First line of the tool's ``--version`` output, or None
+        """
+        if check.version is not None or not check.available:
+            return check.version
+
+        command = _VERSION_COMMANDS.get(check.name)
+        if command is None:
+            return None
+
+        if check.name not in self._versions:
+            self._versions[check.name] = self._probe_version(command)
+        return self._versions[check.name]
+
+    def _probe_version(self, command: str) -> str | None:
+        """Run ``<command> --version`` and return the first line of its output.
+
+        Only stdout is piped and it is decoded by hand, and ``close_fds=False``
+        lets CPython launch the child with ``posix_spawn`` instead of
+        ``fork``/``exec``.
+        """
+        try:
+            result = subprocess.run(  # noqa: S603
+                [command, "--version"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+                close_fds=False,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            logger.debug("Could not determine %s version: %s", command, exc)
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        output = result.stdout[:_VERSION_OUTPUT_LIMIT].decode("ascii", "replace")
+        return output.split("\n", 1)[0].strip()
+
+    def get_search_backend_version(self) -> str | None:
+        """Get the version string of the available search backend.
+
+        Returns:
+            str | None: Search backend version, or None if unavailable
+        """
+        return self.get_version(self.check_search_backend())
+
     def get_search_backend_name(self) -> str:
         """Get the name of the available search backend.
 
+        Reuses the cached search backend check rather than re-probing.
+
         Returns:
             str: 'ripgrep', 'grep', or 'none'
         """
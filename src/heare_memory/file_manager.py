@@ -2,14 +2,18 @@
 
 import asyncio
 import contextlib
+import itertools
 import logging
-import tempfile
+import os
+import uuid
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 import aiofiles
 import aiofiles.os
 
 from .config import settings
+from .fs_utils import fsync_directory
 from .models.file_metadata import (
     DirectoryListing,
     FileMetadata,
@@ -18,21 +22,92 @@ from .models.file_metadata import (
 )
 from .path_utils import (
     PathValidationError,
-    ensure_parent_directory,
     get_relative_path,
     list_directory_paths,
     resolve_memory_path,
+    resolve_sanitized_path,
     sanitize_path,
     validate_path,
+    validate_prefix,
 )
 
 logger = logging.getLogger(__name__)
 
+# Number of write locks; paths hash onto one of them
+_LOCK_STRIPES = 64
+
+# Bound FileManager method that carries out one FileOperation action
+_OperationHandler = Callable[[FileOperation], Awaitable[FileOperationResult]]
+
+
+def _chain_key(path: str) -> str:
+    """Key operations by the file they resolve to, so aliases share one chain."""
+    try:
+        return sanitize_path(path)
+    except PathValidationError:
+        return path
+
 
 class FileManagerError(Exception):
     """Base exception for file manager operations."""
 
 
+def _read_with_stat_sync(file_path: Path) -> tuple[bytes, os.stat_result]:
+    """
+    Read a file's raw bytes and stat it through the same open descriptor.
+
+    Blocking; run it in a worker thread.
+
+    Args:
+        file_path: Absolute path of the file to read
+
+    Returns:
+        Tuple of file content and its stat result
+    """
+    with open(file_path, "rb") as f:
+        file_stat = os.fstat(f.fileno())
+        data = f.read()
+    return data, file_stat
+
+
+def _atomic_write_sync(file_path: Path, data: bytes) -> os.stat_result:
+    """
+    Write bytes to a file atomically via a temporary file and ``os.replace``.
+
+    Blocking; run it in a worker thread.
+
+    Args:
+        file_path: Absolute path of the file to write
+        data: Encoded content to write
+
+    Returns:
+        Stat result of the written file
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a uniquely named temporary file in the same directory first
+    temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            file_stat = os.fstat(f.fileno())
+
+        # Atomically move temporary file to final location
+        os.replace(temp_path, file_path)
+    except BaseException:
+        # Clean up temporary file on error
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+    # Persist the rename itself, not just the file contents
+    fsync_directory(file_path.parent)
+    return file_stat
+
+
 class FileManager:
     """
     Async file system operations manager with security and atomicity guarantees.
@@ -43,7 +118,27 @@ class FileManager:
 
     def __init__(self):
         """Initialize the file manager."""
-        self._lock = asyncio.Lock()
+        self._locks = tuple(asyncio.Lock() for _ in range(_LOCK_STRIPES))
+        self._memory_root_source: Path = settings.memory_root
+        self._memory_root: Path = settings.memory_root.resolve()
+        self._dispatch: dict[str, _OperationHandler] = {
+            "read": self._do_read,
+            "write": self._do_write,
+            "delete": self._do_delete,
+            "exists": self._do_exists,
+            "metadata": self._do_metadata,
+        }
+
+    def _get_memory_root(self) -> Path:
+        """Get the resolved memory root, resolving again only if the setting changed."""
+        if settings.memory_root != self._memory_root_source:
+            self._memory_root_source = settings.memory_root
+            self._memory_root = settings.memory_root.resolve()
+        return self._memory_root
+
+    def _lock_for(self, validated_path: str) -> asyncio.Lock:
+        """Get the write lock guarding a path, shared with other paths on the same stripe."""
+        return self._locks[hash(validated_path) % _LOCK_STRIPES]
 
     async def read_file(self, path: str) -> str:
         """
@@ -59,23 +154,80 @@ class FileManager:
             FileManagerError: If file cannot be read
             PathValidationError: If path is invalid
         """
-        # Validate and resolve path
-        validated_path = sanitize_path(path)
-        file_path = resolve_memory_path(validated_path)
+        content, _ = await self.read_file_with_metadata(path)
+        return content
+
+    async def read_file_bytes(self, path: str) -> bytes:
+        """
+        Read the raw UTF-8 bytes of a memory file without decoding them.
+
+        Args:
+            path: Memory path to read
+
+        Returns:
+            File content as bytes
+
+        Raises:
+            FileManagerError: If file cannot be read
+            PathValidationError: If path is invalid
+        """
+        _, data, _ = await self._read_raw(path)
+        return data
+
+    async def read_file_with_metadata(self, path: str) -> tuple[str, FileMetadata]:
+        """
+        Read content and metadata from a memory file.
+
+        The metadata comes from ``fstat`` on the descriptor used for reading,
+        so no separate stat of the path is needed.
+
+        Args:
+            path: Memory path to read
+
+        Returns:
+            Tuple of file content and FileMetadata
+
+        Raises:
+            FileManagerError: If file cannot be read
+            PathValidationError: If path is invalid
+        """
+        validated_path, data, file_stat = await self._read_raw(path)
 
         try:
-            if not await aiofiles.os.path.exists(str(file_path)):
-                raise FileManagerError(f"File not found: {validated_path}")
+            content = data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise FileManagerError(f"Failed to read file {validated_path}: {e}") from e
+
+        return content, FileMetadata.from_stat(file_stat, validated_path)
 
-            async with aiofiles.open(file_path, encoding="utf-8") as f:
-                content = await f.read()
+    async def _read_raw(self, path: str) -> tuple[str, bytes, os.stat_result]:
+        """
+        Read a memory file's bytes and stat result.
+
+        Args:
+            path: Memory path to read
 
-            logger.debug(f"Read file: {validated_path} ({len(content)} bytes)")
-            return content
+        Returns:
+            Tuple of the validated memory path, file bytes and stat result
 
-        except (OSError, UnicodeDecodeError) as e:
+        Raises:
+            FileManagerError: If file cannot be read
+            PathValidationError: If path is invalid
+        """
+        # Validate and resolve path
+        validated_path, file_path = resolve_sanitized_path(path)
+
+        try:
+            # Let open() report a missing file rather than stat-ing it first
+            data, file_stat = await asyncio.to_thread(_read_with_stat_sync, file_path)
+        except FileNotFoundError as e:
+            raise FileManagerError(f"File not found: {validated_path}") from e
+        except OSError as e:
             raise FileManagerError(f"Failed to read file {validated_path}: {e}") from e
 
+        logger.debug("Read file: %s (%d bytes)", validated_path, len(data))
+        return validated_path, data, file_stat
+
     async def write_file(self, path: str, content: str) -> FileMetadata:
         """
         Write content to a memory file atomically.
@@ -92,42 +244,26 @@ class FileManager:
             PathValidationError: If path is invalid
         """
         # Validate and resolve path
-        validated_path = sanitize_path(path)
-        file_path = resolve_memory_path(validated_path)
+        validated_path, file_path = resolve_sanitized_path(path)
 
-        # Ensure parent directory exists
-        ensure_parent_directory(validated_path)
+        # Encode once up front so invalid content fails before taking the lock
+        try:
+            data = content.encode("utf-8")
+        except UnicodeEncodeError as e:
+            raise FileManagerError(f"Failed to write file {validated_path}: {e}") from e
 
-        # Use async lock for thread safety
-        async with self._lock:
+        # Serialize writes to the same path; writes to other paths proceed concurrently
+        async with self._lock_for(validated_path):
             try:
-                # Write to temporary file first for atomicity
-                temp_dir = file_path.parent
-                temp_fd, temp_path = tempfile.mkstemp(
-                    suffix=".tmp", prefix=f".{file_path.name}_", dir=temp_dir, text=True
-                )
-
-                try:
-                    # Write content to temporary file
-                    async with aiofiles.open(temp_fd, "w", encoding="utf-8", closefd=True) as f:
-                        await f.write(content)
-
-                    # Atomically move temporary file to final location
-                    await aiofiles.os.rename(temp_path, str(file_path))
-
-                    logger.debug(f"Wrote file: {validated_path} ({len(content)} bytes)")
-
-                    # Return metadata for the written file
-                    return FileMetadata.from_path(file_path, validated_path)
+                # One worker thread hop for mkdir, write, fsync and rename
+                file_stat = await asyncio.to_thread(_atomic_write_sync, file_path, data)
+            except OSError as e:
+                raise FileManagerError(f"Failed to write file {validated_path}: {e}") from e
 
-                except Exception:
-                    # Clean up temporary file on error
-                    with contextlib.suppress(OSError):
-                        await aiofiles.os.unlink(temp_path)
-                    raise
+        logger.debug("Wrote file: %s (%d bytes)", validated_path, len(data))
 
-            except (OSError, UnicodeEncodeError) as e:
-                raise FileManagerError(f"Failed to write file {validated_path}: {e}") from e
+        # Metadata comes from the descriptor that wrote the file
+        return FileMetadata.from_stat(file_stat, validated_path)
 
     async def delete_file(self, path: str) -> bool:
         """
@@ -144,18 +280,19 @@ class FileManager:
             PathValidationError: If path is invalid
         """
         # Validate and resolve path
-        validated_path = sanitize_path(path)
-        file_path = resolve_memory_path(validated_path)
+        validated_path, file_path = resolve_sanitized_path(path)
 
         try:
-            if not await aiofiles.os.path.exists(str(file_path)):
+            try:
+                await aiofiles.os.unlink(file_path)
+            except FileNotFoundError:
                 return False
 
-            await aiofiles.os.unlink(str(file_path))
-            logger.debug(f"Deleted file: {validated_path}")
+            logger.debug("Deleted file: %s", validated_path)
 
-            # Clean up empty parent directories
-            await self._cleanup_empty_directories(file_path.parent)
+            # Clean up empty parent directories; top-level files leave nothing to clean
+            if file_path.parent != self._get_memory_root():
+                await self._cleanup_empty_directories(file_path.parent)
 
             return True
 
@@ -176,9 +313,8 @@ class FileManager:
             PathValidationError: If path is invalid
         """
         try:
-            validated_path = sanitize_path(path)
-            file_path = resolve_memory_path(validated_path)
-            return await aiofiles.os.path.exists(str(file_path))
+            validated_path, file_path = resolve_sanitized_path(path)
+            return await aiofiles.os.path.exists(file_path)
         except PathValidationError:
             return False
 
@@ -195,8 +331,7 @@ class FileManager:
         Raises:
             PathValidationError: If path is invalid
         """
-        validated_path = sanitize_path(path)
-        file_path = resolve_memory_path(validated_path)
+        validated_path, file_path = resolve_sanitized_path(path)
         return FileMetadata.from_path(file_path, validated_path)
 
     async def list_files(
@@ -218,7 +353,7 @@ class FileManager:
         if prefix and prefix.strip():
             # Validate prefix (treat as directory, so no .md extension required)
             try:
-                validate_path(prefix + ".md")  # Temporary validation
+                validate_prefix(prefix.rstrip("/"))
                 prefix = prefix.rstrip("/")
             except PathValidationError:
                 # If validation fails, try without .md
@@ -229,36 +364,82 @@ class FileManager:
 
         try:
             if recursive:
-                # Get all files and filter by prefix
-                all_paths = list_directory_paths()
-                if prefix:
-                    filtered_paths = [
-                        p for p in all_paths if p.startswith(prefix + "/") or p == prefix + ".md"
-                    ]
-                else:
-                    filtered_paths = all_paths
+                # Walk only the prefix directory rather than filtering the whole tree
+                filtered_paths = await asyncio.to_thread(self._scan_tree, prefix)
             else:
                 # Only get files directly in the prefix directory
-                memory_root = settings.memory_root.resolve()
-                search_dir = memory_root / prefix if prefix else memory_root
-
-                if not search_dir.exists():
-                    filtered_paths = []
-                else:
-                    filtered_paths = []
-                    for path in search_dir.glob("*.md"):
-                        try:
-                            relative_path = get_relative_path(path)
-                            validate_path(relative_path)
-                            filtered_paths.append(relative_path)
-                        except PathValidationError:
-                            continue
+                filtered_paths = await asyncio.to_thread(self._scan_directory, prefix)
 
             return DirectoryListing.from_paths(prefix, filtered_paths)
 
         except Exception as e:
             raise FileManagerError(f"Failed to list files in {prefix}: {e}") from e
 
+    def _scan_tree(self, prefix: str) -> list[str]:
+        """
+        List memory paths under a prefix directory, recursively.
+
+        Blocking; run it in a worker thread.
+
+        Args:
+            prefix: Validated directory prefix (empty for memory root)
+
+        Returns:
+            Sorted memory paths under the prefix, preceded by ``<prefix>.md``
+            when that file exists
+        """
+        paths = list_directory_paths(prefix)
+        if not prefix:
+            return paths
+
+        # A file named after the prefix sorts ahead of everything inside it
+        sibling = prefix + ".md"
+        try:
+            # Rejects a sibling symlinked to a file outside memory root
+            sibling_path = resolve_memory_path(sibling)
+        except PathValidationError:
+            return paths
+        if sibling_path.is_file():
+            paths.insert(0, sibling)
+        return paths
+
+    def _scan_directory(self, prefix: str) -> list[str]:
+        """
+        List memory paths directly inside a prefix directory.
+
+        Blocking; run it in a worker thread.
+
+        Args:
+            prefix: Validated directory prefix (empty for memory root)
+
+        Returns:
+            Memory paths of the valid files in the directory
+        """
+        memory_root = self._get_memory_root()
+        search_dir = memory_root / prefix if prefix else memory_root
+
+        paths: list[str] = []
+        if not search_dir.exists():
+            return paths
+
+        base = get_relative_path(search_dir) + "/" if prefix else ""
+        # scandir reports entry types from the directory listing itself,
+        # so matching files needs no per-entry stat
+        with os.scandir(search_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md"):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                relative_path = base + entry.name
+                try:
+                    validate_path(relative_path)
+                except PathValidationError:
+                    continue
+                paths.append(relative_path)
+
+        return paths
+
     async def ensure_directory(self, path: str) -> bool:
         """
         Ensure a directory exists within memory root.
@@ -273,14 +454,12 @@ class FileManager:
             FileManagerError: If directory cannot be created
         """
         try:
-            # For directories, we'll validate as if it's a file path but ignore .md requirement
+            # Directories follow the file path rules minus the .md requirement
             directory_path = path.rstrip("/")
-            if directory_path and not directory_path.endswith(".md"):
-                # Validate the directory path by temporarily adding .md
-                temp_path = directory_path + "/temp.md"
-                validate_path(temp_path)
+            if directory_path:
+                validate_prefix(directory_path)
 
-            memory_root = settings.memory_root.resolve()
+            memory_root = self._get_memory_root()
             full_path = memory_root / directory_path if directory_path else memory_root
 
             # Ensure path is within memory root
@@ -299,32 +478,46 @@ class FileManager:
         """
         Recursively remove empty directories up to memory root.
 
+        The walk runs in a single worker thread hop rather than blocking the
+        event loop once per level.
+
         Args:
             directory: Directory to start cleanup from
         """
-        memory_root = settings.memory_root.resolve()
-
         try:
-            current = directory.resolve()
+            await asyncio.to_thread(
+                self._cleanup_empty_directories_sync, directory, self._get_memory_root()
+            )
+        except Exception as e:
+            # Don't fail the main operation if cleanup fails
+            logger.warning("Failed to cleanup empty directories: %s", e)
 
-            while current != memory_root and current.exists():
-                # Check if directory is empty
-                try:
-                    contents = list(current.iterdir())
-                    if not contents:
-                        await aiofiles.os.rmdir(str(current))
-                        logger.debug(f"Cleaned up empty directory: {current}")
-                        current = current.parent
-                    else:
-                        # Directory not empty, stop cleanup
-                        break
-                except OSError:
-                    # Permission error or other issue, stop cleanup
+    @staticmethod
+    def _cleanup_empty_directories_sync(directory: Path, memory_root: Path) -> None:
+        """
+        Remove empty directories from ``directory`` up to ``memory_root``.
+
+        Args:
+            directory: Directory to start cleanup from
+            memory_root: Resolved memory root, which is never removed
+        """
+        current = directory.resolve()
+
+        while current != memory_root and current.exists():
+            # Check if directory is empty
+            try:
+                with os.scandir(current) as entries:
+                    is_empty = next(entries, None) is None
+                if not is_empty:
+                    # Directory not empty, stop cleanup
                     break
+                os.rmdir(current)
+            except OSError:
+                # Permission error or other issue, stop cleanup
+                break
 
-        except Exception as e:
-            # Don't fail the main operation if cleanup fails
-            logger.warning(f"Failed to cleanup empty directories: {e}")
+            logger.debug("Cleaned up empty directory: %s", current)
+            current = current.parent
 
     async def perform_operation(self, operation: FileOperation) -> FileOperationResult:
         """
@@ -341,51 +534,84 @@ class FileManager:
                 operation.path, operation.action, f"Invalid action: {operation.action}"
             )
 
-        try:
-            if operation.action == "read":
-                content = await self.read_file(operation.path)
-                metadata = await self.get_file_metadata(operation.path)
-                return FileOperationResult.success_result(
-                    operation.path, "read", content=content, metadata=metadata
-                )
-
-            elif operation.action == "write":
-                if operation.content is None:
-                    return FileOperationResult.error_result(
-                        operation.path, "write", "Content required for write operation"
-                    )
-                metadata = await self.write_file(operation.path, operation.content)
-                return FileOperationResult.success_result(
-                    operation.path, "write", metadata=metadata
-                )
-
-            elif operation.action == "delete":
-                deleted = await self.delete_file(operation.path)
-                return FileOperationResult.success_result(
-                    operation.path, "delete", content=str(deleted)
-                )
-
-            elif operation.action == "exists":
-                exists = await self.file_exists(operation.path)
-                return FileOperationResult.success_result(
-                    operation.path, "exists", content=str(exists)
-                )
-
-            elif operation.action == "metadata":
-                metadata = await self.get_file_metadata(operation.path)
-                return FileOperationResult.success_result(
-                    operation.path, "metadata", metadata=metadata
-                )
-
-            else:
-                return FileOperationResult.error_result(
-                    operation.path, operation.action, f"Unsupported action: {operation.action}"
-                )
+        handler = self._dispatch.get(operation.action)
+        if handler is None:
+            return FileOperationResult.error_result(
+                operation.path, operation.action, f"Unsupported action: {operation.action}"
+            )
 
+        try:
+            return await handler(operation)
         except (FileManagerError, PathValidationError) as e:
             return FileOperationResult.error_result(operation.path, operation.action, str(e))
         except Exception as e:
-            logger.error(f"Unexpected error in file operation: {e}")
+            logger.error("Unexpected error in file operation: %s", e)
             return FileOperationResult.error_result(
                 operation.path, operation.action, f"Internal error: {e}"
             )
+
+    async def _do_read(self, operation: FileOperation) -> FileOperationResult:
+        """Handle a read operation."""
+        content, metadata = await self.read_file_with_metadata(operation.path)
+        return FileOperationResult.success_result(
+            operation.path, "read", content=content, metadata=metadata
+        )
+
+    async def _do_write(self, operation: FileOperation) -> FileOperationResult:
+        """Handle a write operation."""
+        if operation.content is None:
+            return FileOperationResult.error_result(
+                operation.path, "write", "Content required for write operation"
+            )
+        metadata = await self.write_file(operation.path, operation.content)
+        return FileOperationResult.success_result(operation.path, "write", metadata=metadata)
+
+    async def _do_delete(self, operation: FileOperation) -> FileOperationResult:
+        """Handle a delete operation."""
+        deleted = await self.delete_file(operation.path)
+        return FileOperationResult.success_result(operation.path, "delete", content=str(deleted))
+
+    async def _do_exists(self, operation: FileOperation) -> FileOperationResult:
+        """Handle an exists operation."""
+        exists = await self.file_exists(operation.path)
+        return FileOperationResult.success_result(operation.path, "exists", content=str(exists))
+
+    async def _do_metadata(self, operation: FileOperation) -> FileOperationResult:
+        """Handle a metadata operation."""
+        metadata = await self.get_file_metadata(operation.path)
+        return FileOperationResult.success_result(operation.path, "metadata", metadata=metadata)
+
+    async def perform_operations(
+        self, operations: list[FileOperation], concurrency: int = 32
+    ) -> list[FileOperationResult]:
+        """
+        Perform a batch of file operations concurrently.
+
+        Operations are chained per path so that operations on the same file,
+        reads included, apply in submission order, while operations on
+        different files overlap.
+
+        Args:
+            operations: FileOperations to perform
+            concurrency: Maximum number of operations in flight at once
+
+        Returns:
+            FileOperationResults in the same order as ``operations``
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_chain(indices: list[int]) -> list[tuple[int, FileOperationResult]]:
+            chain_results = []
+            for index in indices:
+                async with semaphore:
+                    result = await self.perform_operation(operations[index])
+                chain_results.append((index, result))
+            return chain_results
+
+        chains: dict[str, list[int]] = {}
+        for index, operation in enumerate(operations):
+            chains.setdefault(_chain_key(operation.path), []).append(index)
+
+        chain_results = await asyncio.gather(*(run_chain(indices) for indices in chains.values()))
+        by_index = dict(itertools.chain.from_iterable(chain_results))
+        return [by_index[index] for index in range(len(operations))]
@@ -0,0 +1,31 @@
+"""File system helpers shared by the file and git managers."""
+
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def fsync_directory(directory: Path) -> None:
+    """
+    Flush a directory's entries to disk so a completed rename survives a crash.
+
+    Platforms that cannot open directories (Windows) are skipped, and flush
+    failures are logged rather than raised.
+
+    Args:
+        directory: Directory to flush
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError as e:
+        # Some filesystems reject directory fsync; the rename has still happened
+        logger.debug("Could not fsync directory %s: %s", directory, e)
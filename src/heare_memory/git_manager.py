@@ -2,14 +2,21 @@
 
 import asyncio
 import logging
-import subprocess
+import os
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from io import BytesIO
 from pathlib import Path
+from typing import Any
 
-from git import Repo
+from git import BaseIndexEntry, Blob, Commit, Repo
 from git.exc import GitCommandError
+from gitdb import IStream
 
 from .config import settings
+from .fs_utils import fsync_directory
 from .models.git import (
     GitBatchOperation,
     GitCommitError,
@@ -23,20 +30,143 @@ from .models.git import (
 
 logger = logging.getLogger(__name__)
 
+# Queued file changes wait this long for further changes before being committed together
+_DEFAULT_COMMIT_DELAY = 0.05
+_DEFAULT_MAX_BATCH_SIZE = 64
+# Pushes wait this long so that commits made meanwhile go out together
+_DEFAULT_PUSH_DELAY = 0.1
+# Repository status is reused for this long unless a commit or push invalidates it
+_STATUS_CACHE_TTL = 2.0
+# Index mode for a regular, non-executable file
+_BLOB_MODE = 0o100644
+# Pushes send the token to this credential helper through the environment only
+_TOKEN_ENV_VAR = "GITHUB_TOKEN"  # noqa: S105
+_CREDENTIAL_HELPER = (
+    '!f() { test "$1" = get && echo username=x-access-token && echo "password=$GITHUB_TOKEN"; }; f'
+)
+
+
+@dataclass(slots=True)
+class _PendingChange:
+    """A queued file change awaiting the next coalesced commit."""
+
+    file_path: str
+    content: str | None  # None deletes the file
+    message: str
+    start_time: float
+    future: asyncio.Future[GitOperationResult] = field(init=False)
+
+
+def _write_file(file_path: Path, data: bytes) -> None:
+    """Write a working-tree file with unbuffered writes.
+
+    No fsync is issued; durability is left to git at commit time.
+
+    Args:
+        file_path: File to create or truncate
+        data: Encoded file content
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _ensure_parent(file_path: Path, directories: set[Path]) -> None:
+    """Create a file's parent directory unless this batch already has.
+
+    Args:
+        file_path: File about to be written
+        directories: Directories already created or touched in this batch; updated in place
+    """
+    parent = file_path.parent
+    if parent not in directories:
+        parent.mkdir(parents=True, exist_ok=True)
+        directories.add(parent)
+
+
+def _parse_porcelain_status(output: bytes) -> tuple[bool, bool]:
+    """Reduce ``git status --porcelain=v1 -z`` output to two flags.
+
+    Args:
+        output: Raw NUL-separated status records
+
+    Returns:
+        tuple[bool, bool]: Whether tracked files changed, and whether untracked files exist
+    """
+    is_dirty = has_untracked = False
+    records = iter(output.split(b"\0"))
+    for record in records:
+        if not record:
+            continue
+        status = record[:2]
+        if status == b"??":
+            has_untracked = True
+        else:
+            is_dirty = True
+            if status[:1] in (b"R", b"C"):
+                # Renames and copies are followed by a record holding the source path
+                next(records, None)
+        if is_dirty and has_untracked:
+            break
+    return is_dirty, has_untracked
+
+
+def _batch_message(changes: list[_PendingChange]) -> str:
+    """Build the commit message for a group of coalesced changes.
+
+    Args:
+        changes: Changes included in the commit
+
+    Returns:
+        str: The single change's message, or a summary listing every message
+    """
+    if len(changes) == 1:
+        return changes[0].message
+    details = "\n".join(f"- {change.message}" for change in changes)
+    return f"Apply {len(changes)} memory changes\n\n{details}"
+
 
 class GitManager:
     """Manages git operations for the memory service."""
 
-    def __init__(self, repository_path: Path | None = None):
+    def __init__(
+        self,
+        repository_path: Path | None = None,
+        commit_delay: float = _DEFAULT_COMMIT_DELAY,
+        max_batch_size: int = _DEFAULT_MAX_BATCH_SIZE,
+    ):
         """Initialize GitManager.
 
         Args:
             repository_path: Path to git repository. Uses settings.memory_root if None.
+            commit_delay: Seconds to wait for further changes before committing
+            max_batch_size: Maximum number of file changes per coalesced commit
         """
         self.repository_path = repository_path or settings.memory_root
+        self._root_str = str(self.repository_path)
         self.repo: Repo | None = None
-        self._push_queue: list[str] = []  # Queue of commits to push
-        self._push_lock = asyncio.Lock()
+        # Commits made since the last successful push; git push HEAD sends them all
+        self._unpushed_commits = 0
+        self.push_delay = _DEFAULT_PUSH_DELAY
+        self._push_task: asyncio.Task[GitPushResult] | None = None  # Push in progress
+        self._next_push: asyncio.Task[GitPushResult] | None = None  # Push waiting to start
+        # Last commit touching each path (None if untracked), valid while HEAD is _file_sha_head
+        self._file_shas: dict[str, str | None] = {}
+        self._file_sha_head: str | None = None
+        # Bumped by every commit and push; a cached status is valid only for the same version
+        self._repo_version = 0
+        # (version, read at, includes last-commit files, status)
+        self._status_cache: tuple[int, float, bool, GitRepositoryStatus] | None = None
+        self.commit_delay = commit_delay
+        self.max_batch_size = max_batch_size
+        self._pending: list[_PendingChange] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        # GitPython is blocking and repo mutation is not thread-safe: one dedicated thread
+        self._git_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="git")
 
     async def initialize_repository(self) -> None:
         """Initialize or validate the git repository.
@@ -84,6 +214,9 @@ class GitManager:
         with self.repo.config_writer() as git_config:
             git_config.set_value("user", "name", "Memory Service")
             git_config.set_value("user", "email", "memory@heare.ai")
+            # Let git defer loose-object fsyncs to one sync per operation
+            git_config.set_value("core", "fsyncMethod", "batch")
+            git_config.set_value("core", "fsync", "loose-object,pack,reference")
 
         # Configure HTTP authentication if token is available
         if settings.github_token and settings.git_remote_url:
@@ -94,9 +227,9 @@ class GitManager:
         if not settings.github_token or not settings.git_remote_url:
             return
 
-        # Configure git credential helper to use token
+        # Configure git credential helper to read the token from the push environment
         with self.repo.config_writer() as git_config:
-            git_config.set_value("credential", "helper", "")
+            git_config.set_value("credential", "helper", _CREDENTIAL_HELPER)
             git_config.set_value("credential", "useHttpPath", "true")
 
     async def _verify_remote_config(self) -> None:
@@ -122,6 +255,9 @@ class GitManager:
     ) -> GitOperationResult:
         """Commit a single file change.
 
+        The change is queued and committed together with any other changes that
+        arrive within the commit delay.
+
         Args:
             file_path: Path to the file relative to repository root
             content: File content to write
@@ -139,33 +275,8 @@ class GitManager:
             if not self.repo:
                 raise GitCommitError("Repository not initialized", "commit_file")
 
-            # Ensure file directory exists
-            full_path = self.repository_path / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write file content
-            full_path.write_text(content, encoding="utf-8")
-
-            # Stage the file
-            self.repo.index.add([file_path])
-
-            # Create commit
-            commit_message = message or f"Update {file_path}"
-            commit = self.repo.index.commit(commit_message)
-
-            # Queue for push
-            async with self._push_lock:
-                self._push_queue.append(commit.hexsha)
-
-            operation_time = time.time() - start_time
-            logger.info("Committed file %s with SHA %s", file_path, commit.hexsha[:8])
-
-            return GitOperationResult(
-                success=True,
-                commit_sha=commit.hexsha,
-                error_message=None,
-                files_changed=[file_path],
-                operation_time=operation_time,
+            return await self._submit_change(
+                _PendingChange(file_path, content, message or f"Update {file_path}", start_time)
             )
 
         except Exception as exc:
@@ -184,6 +295,9 @@ class GitManager:
     async def delete_file(self, file_path: str, message: str | None = None) -> GitOperationResult:
         """Delete a file and commit the change.
 
+        The deletion is queued and committed together with any other changes that
+        arrive within the commit delay.
+
         Args:
             file_path: Path to the file relative to repository root
             message: Custom commit message. Auto-generated if None.
@@ -197,39 +311,8 @@ class GitManager:
             if not self.repo:
                 raise GitCommitError("Repository not initialized", "delete_file")
 
-            full_path = self.repository_path / file_path
-
-            if not full_path.exists():
-                logger.warning("File %s does not exist, skipping deletion", file_path)
-                return GitOperationResult(
-                    success=True,
-                    commit_sha=None,
-                    error_message=None,
-                    files_changed=[],
-                    operation_time=time.time() - start_time,
-                )
-
-            # Remove file and stage deletion
-            full_path.unlink()
-            self.repo.index.remove([file_path])
-
-            # Create commit
-            commit_message = message or f"Delete {file_path}"
-            commit = self.repo.index.commit(commit_message)
-
-            # Queue for push
-            async with self._push_lock:
-                self._push_queue.append(commit.hexsha)
-
-            operation_time = time.time() - start_time
-            logger.info("Deleted file %s with SHA %s", file_path, commit.hexsha[:8])
-
-            return GitOperationResult(
-                success=True,
-                commit_sha=commit.hexsha,
-                error_message=None,
-                files_changed=[file_path],
-                operation_time=operation_time,
+            return await self._submit_change(
+                _PendingChange(file_path, None, message or f"Delete {file_path}", start_time)
             )
 
         except Exception as exc:
@@ -245,6 +328,126 @@ class GitManager:
                 operation_time=operation_time,
             )
 
+    async def _submit_change(self, change: _PendingChange) -> GitOperationResult:
+        """Queue a change for the next coalesced commit and wait for its result.
+
+        Args:
+            change: Pending change to apply
+
+        Returns:
+            GitOperationResult: Result of the change within its commit
+        """
+        change.future = asyncio.get_running_loop().create_future()
+        self._pending.append(change)
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+
+        return await change.future
+
+    async def _flush_pending(self) -> None:
+        """Commit queued changes once the commit delay has elapsed."""
+        await asyncio.sleep(self.commit_delay)
+
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            await self._commit_changes(batch)
+
+    async def _commit_changes(self, batch: list[_PendingChange]) -> None:
+        """Apply queued changes in order and record them as a single commit.
+
+        Args:
+            batch: Pending changes to apply
+        """
+        try:
+            applied, failed, commit_sha = await self._run_git(self._apply_changes, batch)
+
+            if commit_sha:
+                # Queue for push
+                self._unpushed_commits += 1
+
+                logger.info("Committed %d file change(s) with SHA %s", len(applied), commit_sha[:8])
+
+        except Exception as exc:
+            for change in batch:
+                if not change.future.done():
+                    change.future.set_exception(exc)
+            return
+
+        # A change that could not be applied fails alone; the rest still commit
+        for change, exc in failed:
+            if not change.future.done():
+                change.future.set_exception(exc)
+
+        applied_ids = {id(change) for change in applied}
+        for change in batch:
+            if change.future.done():
+                continue
+            changed = id(change) in applied_ids
+            change.future.set_result(
+                GitOperationResult(
+                    success=True,
+                    commit_sha=commit_sha if changed else None,
+                    error_message=None,
+                    files_changed=[change.file_path] if changed else [],
+                    operation_time=time.time() - change.start_time,
+                )
+            )
+
+    def _apply_changes(
+        self, batch: list[_PendingChange]
+    ) -> tuple[list[_PendingChange], list[tuple[_PendingChange, Exception]], str | None]:
+        """Write, stage and commit queued changes. Runs on the git thread.
+
+        Each change is applied on its own, so one that fails is left out of the
+        commit instead of failing every change queued alongside it.
+
+        Args:
+            batch: Pending changes to apply
+
+        Returns:
+            tuple: Changes that touched the tree, changes that failed with their
+                error, and the commit SHA if one was made
+        """
+        applied: list[_PendingChange] = []
+        failed: list[tuple[_PendingChange, Exception]] = []
+        staged: dict[str, bytes | None] = {}
+        directories: set[Path] = set()
+        root = self.repository_path
+
+        for change in batch:
+            full_path = root.joinpath(change.file_path)
+
+            try:
+                if change.content is not None:
+                    data = change.content.encode("utf-8")
+                    _ensure_parent(full_path, directories)
+                    _write_file(full_path, data)
+                    staged[change.file_path] = data
+                    applied.append(change)
+                elif full_path.exists():
+                    full_path.unlink()
+                    directories.add(full_path.parent)
+                    staged[change.file_path] = None
+                    applied.append(change)
+                else:
+                    logger.warning("File %s does not exist, skipping deletion", change.file_path)
+            except Exception as exc:
+                failed.append((change, exc))
+
+        if not applied:
+            return applied, failed, None
+
+        # One directory flush per touched directory, not per file
+        for directory in directories:
+            fsync_directory(directory)
+
+        self._stage_paths(staged)
+        commit = self.repo.index.commit(_batch_message(applied))
+        self._remember_commit(commit, [change.file_path for change in applied])
+        return applied, failed, commit.hexsha
+
     async def batch_commit(self, batch_operation: GitBatchOperation) -> GitOperationResult:
         """Perform a batch of operations as a single commit.
 
@@ -261,49 +464,22 @@ class GitManager:
             if not self.repo:
                 raise GitCommitError("Repository not initialized", "batch_commit")
 
-            # Perform all operations
-            for operation in batch_operation.operations:
-                if operation.operation_type in ("create", "update"):
-                    if not operation.content:
-                        raise GitCommitError(
-                            f"Content required for {operation.operation_type} operation",
-                            "batch_commit",
-                        )
-
-                    # Write file
-                    full_path = self.repository_path / operation.file_path
-                    full_path.parent.mkdir(parents=True, exist_ok=True)
-                    full_path.write_text(operation.content, encoding="utf-8")
-
-                    # Stage file
-                    self.repo.index.add([operation.file_path])
-                    files_changed.append(operation.file_path)
-
-                elif operation.operation_type == "delete":
-                    full_path = self.repository_path / operation.file_path
-                    if full_path.exists():
-                        full_path.unlink()
-                        self.repo.index.remove([operation.file_path])
-                        files_changed.append(operation.file_path)
-
-            # Create single commit for all operations
-            if files_changed:
-                commit = self.repo.index.commit(batch_operation.commit_message)
+            commit_sha = await self._run_git(self._apply_operations, batch_operation, files_changed)
 
+            if commit_sha:
                 # Queue for push
-                async with self._push_lock:
-                    self._push_queue.append(commit.hexsha)
+                self._unpushed_commits += 1
 
                 operation_time = time.time() - start_time
                 logger.info(
                     "Batch commit completed with SHA %s, %d files changed",
-                    commit.hexsha[:8],
+                    commit_sha[:8],
                     len(files_changed),
                 )
 
                 return GitOperationResult(
                     success=True,
-                    commit_sha=commit.hexsha,
+                    commit_sha=commit_sha,
                     error_message=None,
                     files_changed=files_changed,
                     operation_time=operation_time,
@@ -331,9 +507,114 @@ class GitManager:
                 operation_time=operation_time,
             )
 
+    def _apply_operations(
+        self, batch_operation: GitBatchOperation, files_changed: list[str]
+    ) -> str | None:
+        """Apply a batch of operations and commit them. Runs on the git thread.
+
+        Args:
+            batch_operation: Batch operation specification
+            files_changed: List extended in place with each path changed
+
+        Returns:
+            str | None: SHA of the new commit, or None if nothing changed
+        """
+        # Perform all operations, staging only their final state
+        staged: dict[str, bytes | None] = {}
+        directories: set[Path] = set()
+        root = self.repository_path
+        for operation in batch_operation.operations:
+            full_path = root.joinpath(operation.file_path)
+            if operation.operation_type in ("create", "update"):
+                if not operation.content:
+                    raise GitCommitError(
+                        f"Content required for {operation.operation_type} operation",
+                        "batch_commit",
+                    )
+
+                # Write file
+                data = operation.content.encode("utf-8")
+                _ensure_parent(full_path, directories)
+                _write_file(full_path, data)
+
+                staged[operation.file_path] = data
+                files_changed.append(operation.file_path)
+
+            elif operation.operation_type == "delete":
+                if full_path.exists():
+                    full_path.unlink()
+                    directories.add(full_path.parent)
+                    staged[operation.file_path] = None
+                    files_changed.append(operation.file_path)
+
+        if not files_changed:
+            return None
+
+        # One directory flush per touched directory, not per file
+        for directory in directories:
+            fsync_directory(directory)
+
+        # Create single commit for all operations
+        self._stage_paths(staged)
+        commit = self.repo.index.commit(batch_operation.commit_message)
+        self._remember_commit(commit, files_changed)
+        return commit.hexsha
+
+    def _stage_paths(self, staged: dict[str, bytes | None]) -> None:
+        """Stage the final state of a group of paths with a single index write.
+
+        Blobs are stored from the content already in memory, so the files just
+        written to the working tree are not read back and hashed again.
+
+        Args:
+            staged: Mapping of path to its new content, or None if it was deleted
+        """
+        index = self.repo.index
+        removals = [
+            path for path, data in staged.items() if data is None and (path, 0) in index.entries
+        ]
+        additions = [
+            BaseIndexEntry((_BLOB_MODE, self._store_blob(data), 0, path))
+            for path, data in staged.items()
+            if data is not None
+        ]
+
+        # Removal runs through git itself, so do it before the in-memory additions
+        if removals:
+            index.remove(removals)
+        if additions:
+            index.add(additions)
+
+    def _store_blob(self, data: bytes) -> bytes:
+        """Write content to the object database as a blob.
+
+        Args:
+            data: Blob content
+
+        Returns:
+            bytes: Binary SHA of the stored blob
+        """
+        return self.repo.odb.store(IStream(Blob.type, len(data), BytesIO(data))).binsha
+
+    async def _run_git[T](self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking GitPython call on the dedicated git thread.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for the callable
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._git_executor, func, *args)
+
     async def push_changes(self, max_retries: int = 3) -> GitPushResult:
         """Push pending changes to remote repository.
 
+        Concurrent callers share a single push: a call made while a push is
+        running waits for it to finish and then joins the next one.
+
         Args:
             max_retries: Maximum number of retry attempts
 
@@ -344,26 +625,57 @@ class GitManager:
             logger.debug("Skipping push: no GitHub token or remote URL configured")
             return GitPushResult(success=True, error_message=None, retry_count=0, total_time=0.0)
 
-        start_time = time.time()
+        if self._next_push is None:
+            self._next_push = asyncio.create_task(self._push_after(self._push_task, max_retries))
 
-        async with self._push_lock:
-            if not self._push_queue:
-                return GitPushResult(
-                    success=True, error_message=None, retry_count=0, total_time=0.0
-                )
+        # Shield so one caller's cancellation does not abort the shared push
+        return await asyncio.shield(self._next_push)
+
+    async def _push_after(
+        self, previous: asyncio.Task[GitPushResult] | None, max_retries: int
+    ) -> GitPushResult:
+        """Wait for the running push, then push everything queued since.
+
+        Args:
+            previous: Push in progress when this one was requested
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            GitPushResult: Result of the push operation
+        """
+        if previous is not None:
+            await asyncio.wait({previous})
+        await asyncio.sleep(self.push_delay)
+
+        # From here on, new callers need a fresh push to pick up their commits
+        self._push_task, self._next_push = self._next_push, None
+        return await self._push_pending(max_retries)
 
-            pending_commits = self._push_queue.copy()
+    async def _push_pending(self, max_retries: int) -> GitPushResult:
+        """Push the commits currently in the push queue, retrying with backoff.
+
+        Args:
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            GitPushResult: Result of the push operation
+        """
+        start_time = time.time()
+
+        pending_commits = self._unpushed_commits
+        if not pending_commits:
+            return GitPushResult(success=True, error_message=None, retry_count=0, total_time=0.0)
 
         for attempt in range(max_retries + 1):
             try:
                 await self._execute_push()
 
-                # Clear push queue on success
-                async with self._push_lock:
-                    self._push_queue.clear()
+                # Commits made during the push stay pending for the next one
+                self._unpushed_commits -= pending_commits
+                self._repo_version += 1
 
                 total_time = time.time() - start_time
-                logger.info("Successfully pushed %d commits", len(pending_commits))
+                logger.info("Successfully pushed %d commits", pending_commits)
 
                 return GitPushResult(
                     success=True, error_message=None, retry_count=attempt, total_time=total_time
@@ -401,80 +713,199 @@ class GitManager:
         if not self.repo or not settings.github_token or not settings.git_remote_url:
             raise GitPushError("Missing repository, token, or remote URL", "push")
 
-        # Prepare authenticated URL
-        auth_url = settings.git_remote_url.replace("https://", f"https://{settings.github_token}@")
-
-        # Execute push using subprocess for better control
-        # Note: This is safe because we control all inputs - git binary and auth_url validated
-        result = subprocess.run(  # noqa: S603
-            ["git", "push", auth_url, "HEAD"],  # noqa: S607
-            cwd=self.repository_path,
-            capture_output=True,
-            text=True,
-            timeout=30,
+        # The configured credential helper reads the token from the environment
+        env = {**os.environ, _TOKEN_ENV_VAR: settings.github_token, "GIT_TERMINAL_PROMPT": "0"}
+
+        # Push to the configured URL rather than origin, which may point elsewhere
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            "push",
+            settings.git_remote_url,
+            "HEAD",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self._root_str,
+            env=env,
         )
 
-        if result.returncode != 0:
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        if proc.returncode != 0:
+            stdout_text = stdout.decode("utf-8", errors="replace")
+            stderr_text = stderr.decode("utf-8", errors="replace")
             raise GitPushError(
-                f"Git push failed: {result.stderr}",
+                f"Git push failed: {stderr_text}",
                 "push",
-                {"stdout": result.stdout, "stderr": result.stderr},
+                {"stdout": stdout_text, "stderr": stderr_text},
             )
 
-    async def get_repository_status(self) -> GitRepositoryStatus:
+    async def get_repository_status(self, include_files: bool = False) -> GitRepositoryStatus:
         """Get the current status of the git repository.
 
+        Args:
+            include_files: List the files changed by the last commit. Left empty by
+                default because it costs a diff of the whole commit.
+
         Returns:
             GitRepositoryStatus: Current repository status
         """
         if not self.repo:
             raise GitRepositoryError("Repository not initialized", "get_repository_status")
 
-        try:
-            # Get last commit info
-            last_commit = None
-            if self.repo.heads:
-                commit = self.repo.head.commit
-                last_commit = GitCommitInfo(
-                    sha=commit.hexsha,
-                    message=commit.message.strip(),
-                    author=str(commit.author),
-                    timestamp=commit.committed_datetime,
-                    files_changed=list(commit.stats.files.keys()),
-                )
-
-            # Check repository status
-            is_clean = not self.repo.is_dirty()
-            has_uncommitted = self.repo.is_dirty() or bool(self.repo.untracked_files)
+        now = time.monotonic()
+        if self._status_cache is not None:
+            version, cached_at, has_files, status = self._status_cache
+            if (
+                version == self._repo_version
+                and now - cached_at < _STATUS_CACHE_TTL
+                and (has_files or not include_files)
+            ):
+                return status
 
-            # Get remote info
-            remote_url = None
-            ahead_by = 0
-            behind_by = 0
-
-            try:
-                origin = self.repo.remote("origin")
-                remote_url = origin.url
-                # Note: Getting ahead/behind requires network access, skipping for now
-            except Exception as exc:
-                logger.debug("Could not get remote information: %s", exc)
-
-            return GitRepositoryStatus(
-                path=str(self.repository_path),
+        try:
+            version = self._repo_version
+            (last_commit, branch, remote_url), (is_dirty, has_untracked) = await asyncio.gather(
+                self._run_git(self._read_head_state, include_files),
+                self._read_working_tree_state(),
+            )
+            status = GitRepositoryStatus(
+                path=self._root_str,
                 remote_url=remote_url,
-                branch=self.repo.active_branch.name if self.repo.heads else "main",
+                branch=branch,
                 last_commit=last_commit,
-                has_uncommitted_changes=has_uncommitted,
-                is_clean=is_clean,
-                ahead_by=ahead_by,
-                behind_by=behind_by,
+                has_uncommitted_changes=is_dirty or has_untracked,
+                is_clean=not is_dirty,
+                # Note: Getting ahead/behind requires network access, skipping for now
+                ahead_by=0,
+                behind_by=0,
             )
+            self._status_cache = (version, now, include_files, status)
+            return status
 
         except Exception as exc:
             raise GitRepositoryError(
                 f"Failed to get repository status: {exc}", "get_repository_status"
             ) from exc
 
+    def _read_head_state(self, include_files: bool) -> tuple[GitCommitInfo | None, str, str | None]:
+        """Read the last commit, branch and remote URL. Runs on the git thread.
+
+        Args:
+            include_files: Whether to list the files changed by the last commit
+
+        Returns:
+            tuple: Last commit info (None without commits), branch name and origin URL
+        """
+        last_commit = None
+        if self.repo.heads:
+            commit = self.repo.head.commit
+            last_commit = GitCommitInfo(
+                sha=commit.hexsha,
+                message=commit.message.strip(),
+                author=str(commit.author),
+                timestamp=commit.committed_datetime,
+                files_changed=self._commit_files(commit) if include_files else [],
+            )
+
+        remote_url = None
+        try:
+            remote_url = self.repo.remote("origin").url
+        except Exception as exc:
+            logger.debug("Could not get remote information: %s", exc)
+
+        branch = self.repo.active_branch.name if self.repo.heads else "main"
+        return last_commit, branch, remote_url
+
+    def _commit_files(self, commit: Commit) -> list[str]:
+        """List the files a commit changed. Runs on the git thread.
+
+        Args:
+            commit: Commit to inspect
+
+        Returns:
+            list[str]: Changed paths
+        """
+        # Names only; commit.stats would also compute per-file line counts
+        return self.repo.git.diff_tree(
+            "--no-commit-id", "--name-only", "-r", "--root", commit.hexsha
+        ).splitlines()
+
+    async def _read_working_tree_state(self) -> tuple[bool, bool]:
+        """Check for uncommitted and untracked files with a single ``git status`` walk.
+
+        Runs as its own subprocess so it overlaps with the git thread; optional
+        locks are disabled so it never rewrites the index under a commit.
+
+        Returns:
+            tuple[bool, bool]: Whether tracked files changed, and whether untracked files exist
+
+        Raises:
+            GitRepositoryError: If git status fails
+        """
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            "--no-optional-locks",
+            "status",
+            "--porcelain=v1",
+            "-z",
+            "--untracked-files=normal",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self._root_str,
+        )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        if proc.returncode != 0:
+            raise GitRepositoryError(
+                f"git status failed: {stderr.decode('utf-8', errors='replace')}",
+                "get_repository_status",
+            )
+
+        return _parse_porcelain_status(stdout)
+
+    async def _reopen_repo(self) -> None:
+        """Re-open the repository handle, e.g. after git was changed outside the service.
+
+        Drops every cache derived from the previous handle.
+
+        Raises:
+            GitRepositoryError: If the repository cannot be opened
+        """
+        try:
+            self.repo = await self._run_git(Repo, self.repository_path)
+        except Exception as exc:
+            raise GitRepositoryError(f"Failed to reopen repository: {exc}", "reopen_repo") from exc
+
+        self._file_shas = {}
+        self._file_sha_head = None
+        self._repo_version += 1
+
+    def _remember_commit(self, commit: Commit, files_changed: list[str]) -> None:
+        """Record a new commit as the last change to each of its files.
+
+        Args:
+            commit: Commit just created on top of HEAD
+            files_changed: Paths the commit touched
+        """
+        parent_sha = commit.parents[0].hexsha if commit.parents else None
+        if parent_sha != self._file_sha_head:
+            # Cache was built for a different HEAD; start over from this commit
+            self._file_shas = {}
+        self._file_shas.update(dict.fromkeys(files_changed, commit.hexsha))
+        self._file_sha_head = commit.hexsha
+        self._repo_version += 1
+
     async def get_file_sha(self, file_path: str) -> str | None:
         """
         Get the git SHA for a specific file.
@@ -489,25 +920,43 @@ class GitManager:
             GitRepositoryError: If there's an error accessing git
         """
         try:
-            repo = Repo(self.repository_path)
-
-            # Check if there are any commits
-            if not repo.heads:
-                return None
-
-            # Try to get the file's last commit
-            try:
-                commits = list(repo.iter_commits(paths=file_path, max_count=1))
-                if commits:
-                    return commits[0].hexsha
-                else:
-                    # File might be new/uncommitted
-                    return None
-            except GitCommandError:
-                # File might not exist in git
-                return None
+            return await self._run_git(self._lookup_file_sha, file_path)
 
         except Exception as exc:
             logger.error(f"Failed to get file SHA for {file_path}: {exc}")
             # Don't raise exception, return None for missing SHA
             return None
+
+    def _lookup_file_sha(self, file_path: str) -> str | None:
+        """Find the last commit touching a file. Runs on the git thread.
+
+        Args:
+            file_path: Path to the file relative to repository root
+
+        Returns:
+            str | None: Git SHA of the file's last commit, or None if file not in git
+        """
+        # Always use the managed repository; re-opening it per lookup is costly
+        repo = self.repo
+        if repo is None or not repo.heads:
+            return None
+
+        # Answer from the per-path cache while HEAD has not moved
+        head_sha = repo.head.commit.hexsha
+        if head_sha != self._file_sha_head:
+            self._file_shas = {}
+            self._file_sha_head = head_sha
+        elif file_path in self._file_shas:
+            return self._file_shas[file_path]
+
+        # Try to get the file's last commit
+        try:
+            commits = list(repo.iter_commits(paths=file_path, max_count=1))
+        except GitCommandError:
+            # File might not exist in git
+            return None
+
+        # None means the file might be new/uncommitted
+        file_sha = commits[0].hexsha if commits else None
+        self._file_shas[file_path] = file_sha
+        return file_sha
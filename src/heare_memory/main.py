@@ -10,9 +10,11 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from . import __version__
 from .config import settings
+from .file_manager import FileManager
 from .middleware.auth import AuthenticationMiddleware
 from .middleware.error_handler import ErrorHandlerMiddleware
 from .routers import health, memory, schema
+from .services.memory_service import MemoryService
 from .startup import StartupError, format_startup_error, run_startup_checks
 from .state import set_git_manager, set_startup_result
 
@@ -34,6 +36,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         set_git_manager(startup_result.git_manager)
         set_startup_result(startup_result)
 
+        # Build request dependencies once; they hold no per-request state
+        file_manager = FileManager()
+        app.state.file_manager = file_manager
+        app.state.git_manager = startup_result.git_manager
+        app.state.memory_service = MemoryService(
+            file_manager=file_manager, git_manager=startup_result.git_manager
+        )
+
         logger.info("Service initialized successfully")
         if startup_result.warnings:
             for warning in startup_result.warnings:
@@ -63,6 +73,9 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Middleware added last runs first: CORS, then authentication (which assigns
+    # the request ID), then error handling, which reuses that ID
+
     # Add error handling middleware
     app.add_middleware(ErrorHandlerMiddleware)
 
@@ -1,27 +1,66 @@
 """Authentication middleware for memory service."""
 
+import itertools
+import json
 import logging
-import uuid
-from collections.abc import Callable
+import os
+import time
+from collections.abc import Mapping
+from typing import Any
 
-from fastapi import Request, Response
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..config import settings
 from ..models.auth import (
+    READ_ONLY_WRITE_MESSAGE,
     AuthContext,
-    AuthenticationResponse,
     OperationType,
     ReadOnlyModeError,
-    get_operation_type,
-    is_public_endpoint,
+    classify_request,
 )
 
 logger = logging.getLogger(__name__)
 
+# Request IDs only need to be unique for this process's lifetime: PID and start
+# time, then a counter (itertools.count is atomic under the GIL)
+_REQUEST_ID_PREFIX = f"{os.getpid():x}-{int(time.time()):x}-"
+_request_counter = itertools.count()
+
+# The read-only rejection body only varies by path, so everything around it is
+# serialized once with JSONResponse's separators and the path is spliced in
+_READ_ONLY_BODY_PREFIX, _READ_ONLY_BODY_SUFFIX = (
+    json.dumps(
+        {
+            "error": ReadOnlyModeError.default_error_code,
+            "message": READ_ONLY_WRITE_MESSAGE,
+            "details": {"read_only": True, "operation": "write", "path": "\0"},
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    .encode("utf-8")
+    .split(b'"\\u0000"')
+)
+_READ_ONLY_CONTENT_TYPE = (b"content-type", b"application/json")
+
+# Operations that never need the read-only check
+_PASSTHROUGH_OPERATIONS = frozenset({OperationType.READ, OperationType.OPTIONS})
+
+
+def generate_request_id() -> str:
+    """
+    Generate an identifier for tracking a request.
+
+    Returns:
+        Request ID unique within this service process
+    """
+    return _REQUEST_ID_PREFIX + format(next(_request_counter), "x")
+
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
+class AuthenticationMiddleware:
     """
     Authentication middleware for handling read-only mode and request validation.
 
@@ -31,121 +70,235 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
     - Allows public endpoints to bypass authentication
     - Handles CORS preflight requests
     - Provides consistent error responses
+
+    Implemented as plain ASGI: it only inspects the method and path, so it skips
+    the task group and response streaming that BaseHTTPMiddleware adds per request.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
         """
-        Process request through authentication middleware.
+        Initialize the middleware and snapshot the authentication settings.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware or endpoint handler
+            app: Next ASGI application in the stack
+        """
+        self.app = app
+        self.reload()
 
-        Returns:
-            HTTP response
+    def reload(self) -> None:
+        """Re-read authentication settings, which are otherwise fixed after startup."""
+        self._read_only = settings.is_read_only
+        self._token_configured = bool(settings.github_token)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
+        Process request through authentication middleware.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate request ID for tracking
-        request_id = str(uuid.uuid4())
+        request_id = generate_request_id()
 
         # Extract request details
-        method = request.method
-        path = request.url.path
+        method = scope["method"]
+        path = scope["path"]
 
-        # Determine operation type
-        operation_type = get_operation_type(method, path)
-
-        # Check if this is a public endpoint that bypasses authentication
-        bypass_auth = is_public_endpoint(path)
+        # Determine operation type and whether this public endpoint bypasses authentication
+        operation_type, bypass_auth = classify_request(method, path)
 
         # Create authentication context
         auth_context = AuthContext(
             request_id=request_id,
-            read_only_mode=settings.is_read_only,
-            github_token_configured=bool(settings.github_token),
+            read_only_mode=self._read_only,
+            github_token_configured=self._token_configured,
             operation_type=operation_type,
             bypass_auth=bypass_auth,
         )
 
-        # Add authentication context to request state
-        request.state.auth = auth_context
+        # Add authentication context to request state (what Request.state reads);
+        # the request ID is also exposed directly so inner middleware can reuse it
+        state = scope.setdefault("state", {})
+        state["auth"] = auth_context
+        state["request_id"] = request_id
 
         logger.debug(
-            f"Request {request_id}: {method} {path} - "
-            f"operation={operation_type.value}, bypass={bypass_auth}, "
-            f"read_only={auth_context.read_only_mode}"
+            "Request %s: %s %s - operation=%s, bypass=%s, read_only=%s",
+            request_id,
+            method,
+            path,
+            operation_type.value,
+            bypass_auth,
+            auth_context.read_only_mode,
         )
 
-        try:
-            # Perform authentication checks
-            await self._check_authentication(request, auth_context)
+        response_started = False
 
-            # Continue to next middleware or endpoint
-            response = await call_next(request)
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                # Add request ID to response headers for tracking
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-            # Add request ID to response headers for tracking
-            response.headers["X-Request-ID"] = request_id
+        try:
+            # Perform authentication checks; violations are returned rather than
+            # raised so the common rejection path skips traceback capture
+            violation = self._check_authentication(path, auth_context)
+            if violation is not None:
+                logger.warning(
+                    "Request %s: Read-only mode violation - %s %s: %s",
+                    request_id,
+                    method,
+                    path,
+                    violation.message,
+                )
+                await self._send_read_only_rejection(path, request_id, send)
+                return
 
-            return response
+            # Continue to next middleware or endpoint
+            await self.app(scope, receive, send_with_request_id)
 
         except ReadOnlyModeError as e:
-            # Handle read-only mode violations
-            logger.warning(
-                f"Request {request_id}: Read-only mode violation - {method} {path}: {e.message}"
-            )
-
-            return self._create_error_response(
-                status_code=403,
-                error_code=e.error_code,
-                message=e.message,
-                details=e.details,
-                request_id=request_id,
-            )
+            # Handle read-only mode violations raised downstream
+            if response_started:
+                raise
+            response = self._read_only_response(e, request_id, method, path)
+            await response(scope, receive, send)
 
         except Exception as e:
+            # A response already under way cannot be replaced
+            if response_started:
+                raise
+
             # Handle unexpected authentication errors
             logger.error(
-                f"Request {request_id}: Authentication error - {method} {path}: {e}", exc_info=True
+                "Request %s: Authentication error - %s %s: %s",
+                request_id,
+                method,
+                path,
+                e,
+                exc_info=True,
             )
 
-            return self._create_error_response(
+            response = self._create_error_response(
                 status_code=500,
                 error_code="internal_error",
                 message="Internal authentication error occurred",
                 details={"path": path, "method": method},
                 request_id=request_id,
             )
+            await response(scope, receive, send)
 
-    async def _check_authentication(self, request: Request, auth_context: AuthContext) -> None:
+    def _check_authentication(
+        self, path: str, auth_context: AuthContext
+    ) -> ReadOnlyModeError | None:
         """
         Perform authentication checks based on context.
 
         Args:
-            request: HTTP request
+            path: Request path
             auth_context: Authentication context
 
-        Raises:
-            ReadOnlyModeError: If write operation attempted in read-only mode
+        Returns:
+            ReadOnlyModeError if a write operation is attempted in read-only mode,
+            None if the request may proceed
         """
         # Skip authentication for public endpoints
         if auth_context.bypass_auth:
-            logger.debug(f"Request {auth_context.request_id}: Bypassing auth for public endpoint")
-            return
+            logger.debug("Request %s: Bypassing auth for public endpoint", auth_context.request_id)
+            return None
 
         # Skip authentication for read operations
-        if auth_context.operation_type in (OperationType.READ, OperationType.OPTIONS):
-            logger.debug(f"Request {auth_context.request_id}: Allowing read/options operation")
-            return
+        if auth_context.operation_type in _PASSTHROUGH_OPERATIONS:
+            logger.debug("Request %s: Allowing read/options operation", auth_context.request_id)
+            return None
 
         # Check for write operations in read-only mode
         if auth_context.read_only_mode and auth_context.operation_type == OperationType.WRITE:
-            # Extract path from request for better error context
-            path = request.url.path
-            raise ReadOnlyModeError(operation="write", path=path)
+            # Include the path for better error context
+            return ReadOnlyModeError(operation="write", path=path)
+
+        logger.debug("Request %s: Authentication checks passed", auth_context.request_id)
+        return None
+
+    @staticmethod
+    async def _send_read_only_rejection(path: str, request_id: str, send: Send) -> None:
+        """
+        Send the 403 for a write attempted in read-only mode straight to the client.
+
+        The body matches what _create_error_response builds for the violation, but
+        is assembled from the pre-serialized template instead of a JSONResponse.
+
+        Args:
+            path: Request path
+            request_id: Request identifier
+            send: ASGI send channel
+        """
+        if path.isascii() and path.isprintable() and '"' not in path and "\\" not in path:
+            encoded_path = b'"' + path.encode("ascii") + b'"'
+        else:
+            encoded_path = json.dumps(path, ensure_ascii=False).encode("utf-8")
+        body = _READ_ONLY_BODY_PREFIX + encoded_path + _READ_ONLY_BODY_SUFFIX
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 403,
+                "headers": [
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    _READ_ONLY_CONTENT_TYPE,
+                    (b"x-request-id", request_id.encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def _read_only_response(
+        self, error: ReadOnlyModeError, request_id: str, method: str, path: str
+    ) -> JSONResponse:
+        """
+        Log a read-only mode violation and build its 403 response.
+
+        Args:
+            error: The read-only mode violation
+            request_id: Request identifier
+            method: HTTP method
+            path: Request path
 
-        logger.debug(f"Request {auth_context.request_id}: Authentication checks passed")
+        Returns:
+            JSON error response
+        """
+        logger.warning(
+            "Request %s: Read-only mode violation - %s %s: %s",
+            request_id,
+            method,
+            path,
+            error.message,
+        )
+
+        return self._create_error_response(
+            status_code=403,
+            error_code=error.error_code,
+            message=error.message,
+            details=error.details,
+            request_id=request_id,
+        )
 
     def _create_error_response(
-        self, status_code: int, error_code: str, message: str, details: dict, request_id: str
+        self,
+        status_code: int,
+        error_code: str,
+        message: str,
+        details: Mapping[str, Any],
+        request_id: str,
     ) -> JSONResponse:
         """
         Create a standardized error response.
@@ -160,11 +313,13 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         Returns:
             JSON error response
         """
-        error_response = AuthenticationResponse(error=error_code, message=message, details=details)
+        # Same shape as AuthenticationResponse, built directly so the details are
+        # copied once instead of through model validation and .dict()
+        content = {"error": error_code, "message": message, "details": dict(details)}
 
         return JSONResponse(
             status_code=status_code,
-            content=error_response.dict(),
+            content=content,
             headers={"X-Request-ID": request_id},
         )
 
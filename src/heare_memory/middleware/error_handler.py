@@ -3,42 +3,102 @@
 import logging
 from typing import Any
 
-from fastapi import HTTPException, Request, Response
+from fastapi import HTTPException, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .auth import generate_request_id
 
 logger = logging.getLogger(__name__)
 
+# Body of the generic 500 response, encoded once; only debug logging varies it
+_INTERNAL_ERROR_CONTENT: dict[str, Any] = {
+    "error": "internal_server_error",
+    "message": "An internal server error occurred",
+    "details": {},
+}
+_INTERNAL_ERROR_BODY = JSONResponse(_INTERNAL_ERROR_CONTENT).body
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle and format exceptions consistently."""
 
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
-        """Handle request and catch exceptions.
+class ErrorHandlerMiddleware:
+    """Middleware to handle and format exceptions consistently.
+
+    Plain ASGI rather than BaseHTTPMiddleware, so successful requests pass straight
+    through without an extra task group or response streaming.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initialize the middleware.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware or endpoint
+            app: Next ASGI application in the stack
+        """
+        self.app = app
 
-        Returns:
-            Response: The response, possibly with error formatting
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle request and catch exceptions.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_tracking_start)
         except HTTPException:
             # Re-raise HTTP exceptions to let FastAPI handle them
             raise
         except Exception as exc:
-            logger.exception("Unhandled exception in request %s %s", request.method, request.url)
+            # A response already under way cannot be replaced
+            if response_started:
+                raise
+
+            # AuthenticationMiddleware runs first and has usually assigned an ID already
+            request_id = scope.get("state", {}).get("request_id") or generate_request_id()
+            # Log the path from the scope rather than rebuilding the full URL
+            logger.exception(
+                "Request %s: Unhandled exception in %s %s",
+                request_id,
+                scope["method"],
+                scope["path"],
+            )
 
             # Return a structured error response
-            details = {"type": type(exc).__name__} if logger.isEnabledFor(logging.DEBUG) else {}
+            await self._error_response(exc, request_id)(scope, receive, send)
+
+    @staticmethod
+    def _error_response(exc: Exception, request_id: str) -> Response:
+        """Build the generic 500 response.
+
+        Args:
+            exc: The unhandled exception
+            request_id: Request identifier
+
+        Returns:
+            Response: JSON error response
+        """
+        headers = {"X-Request-ID": request_id}
+        if logger.isEnabledFor(logging.DEBUG):
             return JSONResponse(
                 status_code=500,
-                content={
-                    "error": "internal_server_error",
-                    "message": "An internal server error occurred",
-                    "details": details,
-                },
+                content={**_INTERNAL_ERROR_CONTENT, "details": {"type": type(exc).__name__}},
+                headers=headers,
             )
+        return Response(
+            content=_INTERNAL_ERROR_BODY,
+            status_code=500,
+            media_type="application/json",
+            headers=headers,
+        )
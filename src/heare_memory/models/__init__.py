@@ -1 +1,8 @@
 """Data models for Heare Memory service."""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+# Immutable, shared details for errors raised without context
+EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
@@ -1,42 +1,99 @@
 """Authentication models and context for memory service."""
 
-from datetime import datetime
+import functools
+import re
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from . import EMPTY_DETAILS
+
+# Position before each interior capital letter, for CamelCase -> snake_case
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Shared ReadOnlyModeError details for violations without a path, keyed by operation
+_READ_ONLY_DETAILS: dict[str, Mapping[str, Any]] = {}
+
+_READ_ONLY_MESSAGE_TEMPLATE = (
+    "Service is in read-only mode. Configure GITHUB_TOKEN for %s operations."
+)
+# Nearly every violation is a write, so its message is formatted once up front
+READ_ONLY_WRITE_MESSAGE = _READ_ONLY_MESSAGE_TEMPLATE % "write"
+
 
 class AuthenticationError(Exception):
     """Base authentication error."""
 
+    __slots__ = ("_message", "_message_args", "_message_template", "details", "error_code")
+
+    default_error_code = "authentication_error"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Derive the subclass error code from its name once, at class creation."""
+        super().__init_subclass__(**kwargs)
+        if "default_error_code" not in cls.__dict__:
+            cls.default_error_code = _CAMEL_BOUNDARY_RE.sub("_", cls.__name__).lower()
+
     def __init__(
         self,
         message: str,
-        error_code: str = "authentication_error",
-        details: dict[str, Any] | None = None,
+        error_code: str | None = None,
+        details: Mapping[str, Any] | None = None,
+        message_args: tuple[Any, ...] = (),
     ):
+        """
+        Initialize the error.
+
+        Args:
+            message: Error message, or a %-style template when message_args is given
+            error_code: Application error code, defaults to the class default
+            details: Additional error context
+            message_args: Arguments for the message template, formatted on first access
+        """
         super().__init__(message)
-        self.message = message
-        self.error_code = error_code
-        self.details = details or {}
+        self._message_template = message
+        self._message_args = message_args
+        self._message: str | None = None if message_args else message
+        self.error_code = error_code or self.default_error_code
+        self.details = details if details else EMPTY_DETAILS
+
+    @property
+    def message(self) -> str:
+        """Human-readable error message."""
+        if self._message is None:
+            self._message = self._message_template % self._message_args
+        return self._message
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ReadOnlyModeError(AuthenticationError):
     """Raised when write operation is attempted in read-only mode."""
 
+    __slots__ = ()
+
+    default_error_code = "read_only_mode"
+
     def __init__(self, operation: str = "write", path: str | None = None):
-        message = (
-            f"Service is in read-only mode. Configure GITHUB_TOKEN for {operation} operations."
+        # Details without a path only vary by operation, so share one read-only copy
+        base_details = _READ_ONLY_DETAILS.get(operation) or _READ_ONLY_DETAILS.setdefault(
+            operation, MappingProxyType({"read_only": True, "operation": operation})
         )
-        details = {
-            "read_only": True,
-            "operation": operation,
-        }
-        if path:
-            details["path"] = path
+        details = {**base_details, "path": path} if path else base_details
 
-        super().__init__(message=message, error_code="read_only_mode", details=details)
+        if operation == "write":
+            super().__init__(message=READ_ONLY_WRITE_MESSAGE, details=details)
+        else:
+            super().__init__(
+                message=_READ_ONLY_MESSAGE_TEMPLATE, details=details, message_args=(operation,)
+            )
 
 
 class OperationType(str, Enum):
@@ -49,20 +106,32 @@ class OperationType(str, Enum):
     OPTIONS = "options"
 
 
-class AuthContext(BaseModel):
-    """Authentication context for requests."""
+@dataclass(frozen=True, slots=True)
+class AuthContext:
+    """Authentication context for requests.
 
-    request_id: str = Field(description="Unique request identifier")
-    timestamp: datetime = Field(description="Request timestamp", default_factory=datetime.utcnow)
-    read_only_mode: bool = Field(description="Whether service is in read-only mode")
-    github_token_configured: bool = Field(description="Whether GitHub token is configured")
-    operation_type: OperationType = Field(description="Type of operation being performed")
-    bypass_auth: bool = Field(description="Whether authentication is bypassed", default=False)
+    Internal and built on every request, so a slotted dataclass rather than a
+    validated model.
 
-    class Config:
-        """Pydantic configuration."""
+    Attributes:
+        request_id: Unique request identifier
+        read_only_mode: Whether service is in read-only mode
+        github_token_configured: Whether GitHub token is configured
+        operation_type: Type of operation being performed
+        bypass_auth: Whether authentication is bypassed
+    """
+
+    request_id: str
+    read_only_mode: bool
+    github_token_configured: bool
+    operation_type: OperationType
+    bypass_auth: bool = False
+    _created: float = field(default_factory=time.time, init=False, repr=False)
 
-        use_enum_values = True
+    @property
+    def timestamp(self) -> datetime:
+        """Request timestamp (naive UTC), built only when read."""
+        return datetime.fromtimestamp(self._created, UTC).replace(tzinfo=None)
 
 
 class AuthenticationResponse(BaseModel):
@@ -73,6 +142,51 @@ class AuthenticationResponse(BaseModel):
     details: dict[str, Any] = Field(description="Additional error context")
 
 
+# Public endpoints (normalized path) mapped to their fixed operation type; the
+# root has none and is classified by method like any other path. Paths are
+# matched case-sensitively, like the routes themselves, so keys are the
+# canonical lowercase paths
+_PUBLIC_PATHS: dict[str, OperationType | None] = {
+    "health": OperationType.HEALTH,  # Health check endpoint
+    "docs": OperationType.SCHEMA,  # OpenAPI documentation
+    "redoc": OperationType.SCHEMA,  # ReDoc documentation
+    "openapi.json": OperationType.SCHEMA,  # OpenAPI specification
+    "schema": OperationType.SCHEMA,  # Schema endpoint
+    "": None,  # Root might redirect to docs
+}
+
+# Methods that never modify state
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+# Characters a public path can start with after its leading slash: the initials
+# of the named endpoints, plus "/" and "?" which may still lead to a public path
+# once stripped
+_PUBLIC_FIRST_CHARS = frozenset({key[0] for key in _PUBLIC_PATHS if key} | {"/", "?"})
+
+
+def _public_path_key(path: str) -> str | None:
+    """
+    Look up a path in the public endpoint table.
+
+    Most requests are API routes whose first segment rules them out, so they are
+    rejected on one character before the path is normalized.
+
+    Args:
+        path: Request path
+
+    Returns:
+        The normalized public path, or None if the path is not public
+    """
+    first = path[1:2] if path[:1] == "/" else path[:1]
+    if first and first not in _PUBLIC_FIRST_CHARS:
+        return None
+
+    # Drop the query string and surrounding slashes
+    normalized = path.partition("?")[0].strip("/")
+    return normalized if normalized in _PUBLIC_PATHS else None
+
+
 def is_write_operation(method: str, path: str) -> bool:
     """
     Determine if a request represents a write operation.
@@ -84,13 +198,9 @@ def is_write_operation(method: str, path: str) -> bool:
     Returns:
         True if this is a write operation
     """
-    # GET and HEAD are always read operations
-    if method.upper() in ("GET", "HEAD"):
-        return False
-
-    # OPTIONS is for CORS preflight, not a write operation
-    # All other methods (POST, PUT, PATCH, DELETE) are write operations
-    return method.upper() != "OPTIONS"
+    # GET and HEAD are reads and OPTIONS is CORS preflight; POST, PUT, PATCH,
+    # DELETE and anything else are write operations
+    return method.upper() not in _READ_METHODS
 
 
 def is_public_endpoint(path: str) -> bool:
@@ -103,20 +213,7 @@ def is_public_endpoint(path: str) -> bool:
     Returns:
         True if this endpoint should be publicly accessible
     """
-    # Normalize path - remove leading/trailing slashes and query parameters
-    normalized_path = path.strip("/").split("?")[0].lower()
-
-    # Public endpoints that should always be accessible
-    public_paths = {
-        "health",  # Health check endpoint
-        "docs",  # OpenAPI documentation
-        "redoc",  # ReDoc documentation
-        "openapi.json",  # OpenAPI specification
-        "schema",  # Schema endpoint
-        "",  # Root might redirect to docs
-    }
-
-    return normalized_path in public_paths
+    return _public_path_key(path) is not None
 
 
 def get_operation_type(method: str, path: str) -> OperationType:
@@ -130,20 +227,37 @@ def get_operation_type(method: str, path: str) -> OperationType:
     Returns:
         Operation type for authentication context
     """
-    if method.upper() == "OPTIONS":
-        return OperationType.OPTIONS
+    return classify_request(method, path)[0]
 
-    # Check for special endpoints
-    normalized_path = path.strip("/").split("?")[0].lower()
 
-    if normalized_path == "health":
-        return OperationType.HEALTH
+@functools.lru_cache(maxsize=4096)
+def classify_request(method: str, path: str) -> tuple[OperationType, bool]:
+    """
+    Determine a request's operation type and whether it bypasses authentication.
+
+    Normalizes the path once and answers both questions from a single lookup.
+    Clients tend to hit the same URLs repeatedly, so results are cached per
+    exact method and path.
+
+    Args:
+        method: HTTP method
+        path: Request path
+
+    Returns:
+        Operation type and whether the endpoint is public
+    """
+    public_key = _public_path_key(path)
+    is_public = public_key is not None
+    method = method.upper()
+
+    if method == "OPTIONS":
+        return OperationType.OPTIONS, is_public
 
-    if normalized_path in ("schema", "docs", "redoc", "openapi.json"):
-        return OperationType.SCHEMA
+    # Special endpoints have a fixed type regardless of method
+    fixed_type = _PUBLIC_PATHS[public_key] if is_public else None
+    if fixed_type is not None:
+        return fixed_type, True
 
-    # Determine read vs write based on method
-    if is_write_operation(method, path):
-        return OperationType.WRITE
-    else:
-        return OperationType.READ
+    if method in _READ_METHODS:
+        return OperationType.READ, is_public
+    return OperationType.WRITE, is_public
@@ -1,9 +1,15 @@
 """File metadata models for memory operations."""
 
+import os
+import stat
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Actions a FileOperation may request
+_VALID_ACTIONS = frozenset({"read", "write", "delete", "list", "exists", "metadata"})
 
 
 class FileMetadata(BaseModel):
@@ -29,33 +35,50 @@ class FileMetadata(BaseModel):
         Returns:
             FileMetadata instance
         """
-        if not file_path.exists():
+        try:
+            file_stat = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            now = datetime.now()
             return cls(
                 path=memory_path,
                 size=0,
-                created_at=datetime.now(),
-                modified_at=datetime.now(),
+                created_at=now,
+                modified_at=now,
                 exists=False,
                 is_directory=False,
                 permissions="000",
             )
 
-        stat = file_path.stat()
+        return cls.from_stat(file_stat, memory_path)
+
+    @classmethod
+    def from_stat(cls, file_stat: os.stat_result, memory_path: str) -> "FileMetadata":
+        """
+        Create FileMetadata from an existing stat result.
+
+        Args:
+            file_stat: Result of ``os.stat``/``os.fstat`` for the file
+            memory_path: Relative memory path
 
+        Returns:
+            FileMetadata instance
+        """
         return cls(
             path=memory_path,
-            size=stat.st_size,
-            created_at=datetime.fromtimestamp(stat.st_ctime),
-            modified_at=datetime.fromtimestamp(stat.st_mtime),
+            size=file_stat.st_size,
+            created_at=datetime.fromtimestamp(file_stat.st_ctime),
+            modified_at=datetime.fromtimestamp(file_stat.st_mtime),
             exists=True,
-            is_directory=file_path.is_dir(),
-            permissions=oct(stat.st_mode)[-3:],
+            is_directory=stat.S_ISDIR(file_stat.st_mode),
+            permissions=oct(file_stat.st_mode)[-3:],
         )
 
 
 class FileOperation(BaseModel):
     """Represents a file operation to be performed."""
 
+    model_config = ConfigDict(defer_build=True)
+
     action: str = Field(description="Operation type: read, write, delete, list")
     path: str = Field(description="Memory path for the operation")
     content: str | None = Field(default=None, description="Content for write operations")
@@ -63,13 +86,14 @@ class FileOperation(BaseModel):
 
     def validate_action(self) -> bool:
         """Validate that the action is supported."""
-        valid_actions = {"read", "write", "delete", "list", "exists", "metadata"}
-        return self.action in valid_actions
+        return self.action in _VALID_ACTIONS
 
 
 class FileOperationResult(BaseModel):
     """Result of a file operation."""
 
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(description="Whether the operation succeeded")
     path: str = Field(description="Memory path that was operated on")
     action: str = Field(description="Operation that was performed")
@@ -108,6 +132,8 @@ class FileOperationResult(BaseModel):
 class DirectoryListing(BaseModel):
     """Result of listing a directory."""
 
+    model_config = ConfigDict(defer_build=True)
+
     path: str = Field(description="Directory path that was listed")
     files: list[str] = Field(description="List of file paths found")
     directories: list[str] = Field(description="List of subdirectory paths found")
@@ -115,34 +141,35 @@ class DirectoryListing(BaseModel):
     total_directories: int = Field(description="Total number of directories")
 
     @classmethod
-    def from_paths(cls, directory_path: str, file_paths: list[str]) -> "DirectoryListing":
+    def from_paths(cls, directory_path: str, file_paths: Iterable[str]) -> "DirectoryListing":
         """
-        Create a DirectoryListing from a list of file paths.
+        Create a DirectoryListing from file paths.
 
         Args:
             directory_path: The directory that was listed
-            file_paths: List of file paths found
+            file_paths: File paths found, in any order
 
         Returns:
             DirectoryListing instance
         """
-        # Separate files and directories
-        files = []
-        directories = set()
-
-        for path in file_paths:
-            files.append(path)
-
-            # Add all parent directories
-            parts = Path(path).parts
-            for i in range(len(parts) - 1):
-                parent = "/".join(parts[: i + 1])
-                if parent and parent != directory_path:
+        files = sorted(file_paths)
+        directories: set[str] = set()
+
+        # Add all parent directories, walking up each path with rfind rather than
+        # re-joining its parts; once a parent is known, so are its ancestors
+        for path in files:
+            end = path.rfind("/")
+            while end > 0:
+                parent = path[:end]
+                if parent in directories:
+                    break
+                if parent != directory_path:
                     directories.add(parent)
+                end = path.rfind("/", 0, end)
 
         return cls(
             path=directory_path,
-            files=sorted(files),
+            files=files,
             directories=sorted(directories),
             total_files=len(files),
             total_directories=len(directories),
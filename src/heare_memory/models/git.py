@@ -1,10 +1,13 @@
 """Git operation models and data structures."""
 
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from . import EMPTY_DETAILS
 
 
 class GitOperationType(str, Enum):
@@ -19,6 +22,8 @@ class GitOperationType(str, Enum):
 class GitCommitInfo(BaseModel):
     """Information about a git commit."""
 
+    model_config = ConfigDict(defer_build=True)
+
     sha: str = Field(description="Commit SHA hash")
     message: str = Field(description="Commit message")
     author: str = Field(description="Commit author")
@@ -29,6 +34,8 @@ class GitCommitInfo(BaseModel):
 class GitRepositoryStatus(BaseModel):
     """Status of the git repository."""
 
+    model_config = ConfigDict(defer_build=True)
+
     path: str = Field(description="Repository path")
     remote_url: str | None = Field(description="Remote repository URL")
     branch: str = Field(description="Current branch")
@@ -42,6 +49,8 @@ class GitRepositoryStatus(BaseModel):
 class GitOperation(BaseModel):
     """A single git operation to be performed."""
 
+    model_config = ConfigDict(defer_build=True)
+
     operation_type: GitOperationType = Field(description="Type of operation")
     file_path: str = Field(description="Path of file to operate on")
     content: str | None = Field(
@@ -53,6 +62,8 @@ class GitOperation(BaseModel):
 class GitBatchOperation(BaseModel):
     """A batch of git operations to be performed as a single commit."""
 
+    model_config = ConfigDict(defer_build=True)
+
     operations: list[GitOperation] = Field(description="List of operations")
     commit_message: str = Field(description="Commit message for the batch")
 
@@ -60,6 +71,8 @@ class GitBatchOperation(BaseModel):
 class GitOperationResult(BaseModel):
     """Result of a git operation."""
 
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(description="Whether operation succeeded")
     commit_sha: str | None = Field(description="SHA of created commit")
     error_message: str | None = Field(description="Error message if failed")
@@ -70,6 +83,8 @@ class GitOperationResult(BaseModel):
 class GitPushResult(BaseModel):
     """Result of a git push operation."""
 
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(description="Whether push succeeded")
     error_message: str | None = Field(description="Error message if failed")
     retry_count: int = Field(description="Number of retries attempted")
@@ -79,19 +94,27 @@ class GitPushResult(BaseModel):
 class GitError(Exception):
     """Base exception for git operations."""
 
-    def __init__(self, message: str, operation: str, details: dict[str, Any] | None = None):
+    __slots__ = ("details", "operation")
+
+    def __init__(self, message: str, operation: str, details: Mapping[str, Any] | None = None):
         super().__init__(message)
         self.operation = operation
-        self.details = details or {}
+        self.details = details if details else EMPTY_DETAILS
 
 
 class GitRepositoryError(GitError):
     """Exception for git repository related errors."""
 
+    __slots__ = ()
+
 
 class GitCommitError(GitError):
     """Exception for git commit related errors."""
 
+    __slots__ = ()
+
 
 class GitPushError(GitError):
     """Exception for git push related errors."""
+
+    __slots__ = ()
@@ -1,9 +1,8 @@
 """Core memory node data models."""
 
 from datetime import datetime
-from typing import Any
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 from .file_metadata import FileMetadata
 
@@ -36,6 +35,16 @@ class MemoryNode(BaseModel):
     content: str = Field(description="Markdown content")
     metadata: MemoryNodeMetadata = Field(description="Node metadata")
 
+    # Content the cached lines were split from, and the lines themselves
+    _split_lines: tuple[str, list[str]] | None = PrivateAttr(default=None)
+
+    def _lines(self) -> list[str]:
+        """Lines of the content, split once per content value."""
+        cached = self._split_lines
+        if cached is None or cached[0] is not self.content:
+            cached = self._split_lines = (self.content, self.content.splitlines())
+        return cached[1]
+
     @computed_field
     @property
     def content_preview(self) -> str:
@@ -48,7 +57,7 @@ class MemoryNode(BaseModel):
     @property
     def line_count(self) -> int:
         """Number of lines in the content."""
-        return len(self.content.splitlines())
+        return len(self._lines())
 
     @computed_field
     @property
@@ -67,7 +76,7 @@ class MemoryNode(BaseModel):
         Returns:
             List of lines in the specified range
         """
-        lines = self.content.splitlines()
+        lines = self._lines()
 
         start_idx = max(0, start - 1) if start is not None else 0  # Convert to 0-based
         end_idx = (
@@ -87,15 +96,36 @@ class MemoryNode(BaseModel):
         Returns:
             List of line numbers (1-based) containing the query
         """
-        lines = self.content.splitlines()
-        matches = []
+        lines = self._lines()
+        if not query:
+            return list(range(1, len(lines) + 1))
 
         search_query = query if case_sensitive else query.lower()
+        if "\n" in search_query:
+            # Matches never span lines
+            return []
 
-        for i, line in enumerate(lines, 1):
-            search_line = line if case_sensitive else line.lower()
-            if search_query in search_line:
-                matches.append(i)
+        # Scan the whole text with str.find instead of testing line by line;
+        # joining on "\n" gives every line boundary the same single character
+        text = "\n".join(lines)
+        if not case_sensitive:
+            text = text.lower()
+
+        matches = []
+        line_number = 1
+        line_start = 0
+        position = text.find(search_query)
+        while position != -1:
+            line_number += text.count("\n", line_start, position)
+            matches.append(line_number)
+
+            # Resume at the next line so each line is reported once
+            line_end = text.find("\n", position)
+            if line_end == -1:
+                break
+            line_number += 1
+            line_start = line_end + 1
+            position = text.find(search_query, line_start)
 
         return matches
 
@@ -112,54 +142,3 @@ class MemoryNodeList(BaseModel):
     nodes: list[MemoryNode] = Field(description="List of memory nodes")
     total: int = Field(description="Total number of nodes")
     prefix: str | None = Field(description="Filter prefix used")
-
-
-class SearchResult(BaseModel):
-    """A single search result."""
-
-    path: str = Field(description="Path of the matching file")
-    line_number: int = Field(description="Line number of the match")
-    line_content: str = Field(description="Content of the matching line")
-    context_before: list[str] = Field(description="Lines before the match")
-    context_after: list[str] = Field(description="Lines after the match")
-
-
-class SearchResponse(BaseModel):
-    """Response model for search operations."""
-
-    results: list[SearchResult] = Field(description="Search results")
-    total: int = Field(description="Total number of matches")
-    query: str = Field(description="Search query used")
-    prefix: str | None = Field(description="Search prefix used")
-
-
-class BatchOperation(BaseModel):
-    """A single batch operation."""
-
-    action: str = Field(description="Operation type: create, update, delete")
-    path: str = Field(description="Memory node path")
-    content: str | None = Field(description="Content for create/update operations")
-
-
-class BatchRequest(BaseModel):
-    """Request model for batch operations."""
-
-    operations: list[BatchOperation] = Field(description="List of operations to perform")
-    commit_message: str = Field(description="Git commit message for the batch")
-
-
-class BatchResponse(BaseModel):
-    """Response model for batch operations."""
-
-    success: bool = Field(description="Whether all operations succeeded")
-    completed: int = Field(description="Number of completed operations")
-    total: int = Field(description="Total number of operations")
-    commit_sha: str | None = Field(description="Git commit SHA if successful")
-
-
-class ErrorResponse(BaseModel):
-    """Standard error response model."""
-
-    error: str = Field(description="Error code")
-    message: str = Field(description="Human-readable error message")
-    details: dict[str, Any] = Field(description="Additional error details")
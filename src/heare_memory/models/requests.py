@@ -1,11 +1,15 @@
 """Request models for the memory API."""
 
+import re
 from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
 from ..path_utils import sanitize_path, validate_path
 
+# Control characters other than tab, newline and carriage return
+_COMMIT_MESSAGE_CONTROL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
 
 class MemoryCreateRequest(BaseModel):
     """Request model for creating a memory node."""
@@ -240,7 +244,7 @@ class BatchRequest(BaseModel):
             raise ValueError("Commit message cannot be empty")
 
         # Check for control characters
-        if any(ord(c) < 32 for c in v if c not in ("\t", "\n", "\r")):
+        if _COMMIT_MESSAGE_CONTROL_RE.search(v):
             raise ValueError("Commit message contains invalid characters")
 
         return v
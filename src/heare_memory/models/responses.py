@@ -5,50 +5,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field, computed_field
 
-from .file_metadata import FileMetadata
-
-
-class MemoryNodeMetadata(BaseModel):
-    """Enhanced metadata for a memory node."""
-
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last modification timestamp")
-    size: int = Field(description="Content size in bytes", ge=0)
-    sha: str = Field(description="Git SHA of last commit")
-    exists: bool = Field(description="Whether the file exists", default=True)
-
-    @classmethod
-    def from_file_metadata(cls, file_meta: FileMetadata, sha: str) -> "MemoryNodeMetadata":
-        """Create MemoryNodeMetadata from FileMetadata."""
-        return cls(
-            created_at=file_meta.created_at,
-            updated_at=file_meta.modified_at,
-            size=file_meta.size,
-            sha=sha,
-            exists=file_meta.exists,
-        )
-
-
-class MemoryNode(BaseModel):
-    """A memory node with content and metadata."""
-
-    path: str = Field(description="Memory node path")
-    content: str = Field(description="Markdown content")
-    metadata: MemoryNodeMetadata = Field(description="Node metadata")
-
-    @computed_field
-    @property
-    def content_preview(self) -> str:
-        """First 200 characters of content for previews."""
-        if len(self.content) <= 200:
-            return self.content
-        return self.content[:197] + "..."
-
-    @computed_field
-    @property
-    def line_count(self) -> int:
-        """Number of lines in the content."""
-        return len(self.content.splitlines())
+# Memory node models are defined once, in .memory, and shared with these responses
+from .memory import MemoryNode, MemoryNodeMetadata
 
 
 class MemoryNodeSummary(BaseModel):
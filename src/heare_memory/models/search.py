@@ -1,11 +1,13 @@
 """Search result models for memory content search."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SearchMatch(BaseModel):
     """Represents a single match within a file."""
 
+    model_config = ConfigDict(defer_build=True)
+
     line_number: int = Field(description="Line number where the match was found (1-indexed)")
     line_content: str = Field(description="Full content of the matching line")
     highlighted_content: str = Field(description="Line content with query highlighted")
@@ -24,6 +26,8 @@ class SearchMatch(BaseModel):
 class SearchResult(BaseModel):
     """Represents search results for a single file."""
 
+    model_config = ConfigDict(defer_build=True)
+
     path: str = Field(description="Full filesystem path to the file")
     relative_path: str = Field(description="Path relative to memory root")
     matches: list[SearchMatch] = Field(description="All matches found in this file")
@@ -34,6 +38,8 @@ class SearchResult(BaseModel):
 class SearchQuery(BaseModel):
     """Represents a search query with validation."""
 
+    model_config = ConfigDict(defer_build=True)
+
     pattern: str = Field(description="Search pattern or regex")
     is_regex: bool = Field(
         description="Whether the pattern should be treated as regex", default=False
@@ -76,6 +82,8 @@ class SearchQuery(BaseModel):
 class SearchSummary(BaseModel):
     """Summary of search results across all files."""
 
+    model_config = ConfigDict(defer_build=True)
+
     query: str = Field(description="The search query used")
     total_files_searched: int = Field(description="Total number of files searched")
     files_with_matches: int = Field(description="Number of files containing matches")
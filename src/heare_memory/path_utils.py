@@ -1,29 +1,37 @@
 """Path validation and sanitization utilities for memory operations."""
 
+import functools
 import os
 import re
 from pathlib import Path, PurePosixPath
 
 from .config import settings
 
+# Control characters are never valid in a memory path
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
 
-class PathValidationError(Exception):
-    """Raised when path validation fails."""
+# Substrings rejected anywhere in a path
+_DANGEROUS_PATTERNS = (
+    "..",  # Directory traversal
+    "//",  # Double slashes
+    "\\",  # Backslashes (convert to forward slash instead)
+    "./",  # Current directory reference
+)
 
+# Reserved Windows device names, compared against the upper-cased stem of each segment
+_RESERVED_NAMES = frozenset(
+    {"CON", "PRN", "AUX", "NUL"}
+    | {f"COM{i}" for i in range(1, 10)}
+    | {f"LPT{i}" for i in range(1, 10)}
+)
 
-def validate_path(path: str) -> bool:
-    """
-    Validate a memory path for security and format requirements.
 
-    Args:
-        path: The path to validate
+class PathValidationError(Exception):
+    """Raised when path validation fails."""
 
-    Returns:
-        True if path is valid
 
-    Raises:
-        PathValidationError: If path is invalid
-    """
+def _check_path_text(path: str) -> None:
+    """Reject empty, overlong, control-character or dangerous-pattern paths."""
     if not path:
         raise PathValidationError("Path cannot be empty")
 
@@ -31,35 +39,24 @@ def validate_path(path: str) -> bool:
         raise PathValidationError("Path too long (max 1024 characters)")
 
     # Check for control characters and other dangerous characters
-    if re.search(r"[\x00-\x1f\x7f]", path):
+    if _CONTROL_CHARS_RE.search(path):
         raise PathValidationError("Path contains control characters")
 
     # Check for dangerous sequences
-    dangerous_patterns = [
-        "..",  # Directory traversal
-        "//",  # Double slashes
-        "\\",  # Backslashes (convert to forward slash instead)
-        "./",  # Current directory reference
-    ]
-
-    for pattern in dangerous_patterns:
+    for pattern in _DANGEROUS_PATTERNS:
         if pattern in path:
             raise PathValidationError(f"Path contains dangerous pattern: {pattern}")
 
-    # Ensure path ends with .md
-    if not path.endswith(".md"):
-        raise PathValidationError("Path must end with .md extension")
 
-    # Validate path structure using PurePosixPath
+def _check_path_structure(path: str) -> None:
+    """Reject absolute paths and empty, relative or reserved segments."""
     try:
-        posix_path = PurePosixPath(path)
-
         # Check for absolute paths (should be relative)
-        if posix_path.is_absolute():
+        if PurePosixPath(path).is_absolute():
             raise PathValidationError("Path must be relative (no leading /)")
 
-        # Check each part of the path
-        for part in posix_path.parts:
+        # Check each segment as written; PurePosixPath would drop "." segments
+        for part in path.split("/"):
             if not part:  # Empty parts from double slashes
                 raise PathValidationError("Path contains empty segments")
 
@@ -67,36 +64,53 @@ def validate_path(path: str) -> bool:
                 raise PathValidationError(f"Path contains reserved segment: {part}")
 
             # Check for reserved Windows names (just in case)
-            reserved_names = {
-                "CON",
-                "PRN",
-                "AUX",
-                "NUL",
-                "COM1",
-                "COM2",
-                "COM3",
-                "COM4",
-                "COM5",
-                "COM6",
-                "COM7",
-                "COM8",
-                "COM9",
-                "LPT1",
-                "LPT2",
-                "LPT3",
-                "LPT4",
-                "LPT5",
-                "LPT6",
-                "LPT7",
-                "LPT8",
-                "LPT9",
-            }
-            if part.upper().split(".")[0] in reserved_names:
+            if part.upper().split(".")[0] in _RESERVED_NAMES:
                 raise PathValidationError(f"Path contains reserved name: {part}")
 
     except ValueError as e:
         raise PathValidationError(f"Invalid path format: {e}") from e
 
+
+def validate_path(path: str) -> bool:
+    """
+    Validate a memory path for security and format requirements.
+
+    Args:
+        path: The path to validate
+
+    Returns:
+        True if path is valid
+
+    Raises:
+        PathValidationError: If path is invalid
+    """
+    _check_path_text(path)
+
+    # Ensure path ends with .md
+    if not path.endswith(".md"):
+        raise PathValidationError("Path must end with .md extension")
+
+    _check_path_structure(path)
+    return True
+
+
+def validate_prefix(path: str) -> bool:
+    """
+    Validate a directory prefix with the same rules as ``validate_path``.
+
+    Unlike ``validate_path``, no ``.md`` extension is required.
+
+    Args:
+        path: The directory prefix to validate, without a trailing slash
+
+    Returns:
+        True if prefix is valid
+
+    Raises:
+        PathValidationError: If prefix is invalid
+    """
+    _check_path_text(path)
+    _check_path_structure(path)
     return True
 
 
@@ -158,7 +172,11 @@ def resolve_memory_path(path: str) -> Path:
     """
     # Validate the path first
     validate_path(path)
+    return _resolve_within_root(path)
 
+
+def _resolve_within_root(path: str) -> Path:
+    """Join a validated memory path onto memory root, rejecting symlink escapes."""
     # Create absolute path within memory root
     memory_root = settings.memory_root.resolve()
     full_path = memory_root / path
@@ -172,6 +190,34 @@ def resolve_memory_path(path: str) -> Path:
     return full_path
 
 
+def resolve_sanitized_path(path: str) -> tuple[str, Path]:
+    """
+    Sanitize a memory path and resolve it within memory root.
+
+    Equivalent to ``sanitize_path`` followed by ``resolve_memory_path``. The
+    string sanitization is cached, so repeated operations on the same path skip
+    validation. The containment check resolves symlinks and is repeated on
+    every call, since a directory under memory root may since have been
+    replaced with a link pointing outside it.
+
+    Args:
+        path: The memory path to sanitize and resolve
+
+    Returns:
+        Tuple of the sanitized memory path and its absolute Path
+
+    Raises:
+        PathValidationError: If path is invalid or outside memory root
+    """
+    validated_path = _sanitize_path_cached(path)
+    return validated_path, _resolve_within_root(validated_path)
+
+
+# sanitize_path is a pure function of its argument; invalid paths raise and are
+# not cached
+_sanitize_path_cached = functools.lru_cache(maxsize=4096)(sanitize_path)
+
+
 def get_relative_path(absolute_path: Path) -> str:
     """
     Get the relative memory path from an absolute filesystem path.
@@ -245,22 +291,42 @@ def list_directory_paths(directory: str = "") -> list[str]:
         List of memory paths found
     """
     memory_root = settings.memory_root.resolve()
+    root = str(memory_root)
+    search_path = (memory_root / directory).resolve() if directory else memory_root
 
-    search_dir = memory_root / directory if directory else memory_root
-
-    if not search_dir.exists():
+    # Never walk outside memory root, including through a symlinked directory
+    try:
+        search_path.relative_to(memory_root)
+    except ValueError:
         return []
+    search_dir = str(search_path)
 
+    # Relative paths are sliced off the walked directory strings rather than
+    # building and resolving a Path per file
+    root_len = len(root) + 1
     paths = []
-    for path in search_dir.rglob("*.md"):
-        try:
-            relative_path = get_relative_path(path)
-            # Validate the path (this will filter out any invalid files)
-            validate_path(relative_path)
+    for dirpath, dirnames, filenames in os.walk(search_dir):
+        # Symlinked directories are never descended into
+        dirnames[:] = [d for d in dirnames if not os.path.islink(os.path.join(dirpath, d))]
+        base = dirpath[root_len:].replace(os.sep, "/") + "/" if dirpath != root else ""
+        for name in filenames:
+            if not name.endswith(".md"):
+                continue
+            file_path = os.path.join(dirpath, name)
+            if os.path.islink(file_path):
+                # Symlinked files are only listed when their target stays inside root
+                try:
+                    Path(file_path).resolve().relative_to(memory_root)
+                except ValueError:
+                    continue
+            relative_path = base + name
+            try:
+                # Validate the path (this will filter out any invalid files)
+                validate_path(relative_path)
+            except PathValidationError:
+                # Skip invalid paths
+                continue
             paths.append(relative_path)
-        except PathValidationError:
-            # Skip invalid paths
-            continue
 
     return sorted(paths)
 
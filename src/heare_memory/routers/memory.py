@@ -5,9 +5,10 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from ..config import settings
 from ..dependencies import get_memory_service
 from ..models.memory import MemoryNode
-from ..path_utils import PathValidationError, sanitize_path
+from ..path_utils import PathValidationError, sanitize_path, validate_path
 from ..services.memory_service import MemoryNotFoundError, MemoryService, MemoryServiceError
 
 logger = logging.getLogger(__name__)
@@ -51,8 +52,6 @@ async def list_memory_nodes(
         # Validate prefix if provided
         if prefix and prefix.strip():
             try:
-                from ..path_utils import validate_path
-
                 # Validate prefix by adding temporary .md extension
                 test_path = f"{prefix}/temp.md" if not prefix.endswith("/") else f"{prefix}temp.md"
                 validate_path(test_path)
@@ -278,8 +277,6 @@ async def create_or_update_memory_node(
 
     try:
         # Check if service is in read-only mode
-        from ..config import settings
-
         if settings.is_read_only:
             logger.warning(f"Write attempt blocked - service in read-only mode: {path}")
             raise HTTPException(
@@ -440,8 +437,6 @@ async def delete_memory_node(
 
     try:
         # Check if service is in read-only mode
-        from ..config import settings
-
         if settings.is_read_only:
             logger.warning(f"Delete attempt blocked - service in read-only mode: {path}")
             raise HTTPException(
@@ -1,19 +1,26 @@
 """OpenAPI schema router."""
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import JSONResponse
 
 router = APIRouter(tags=["schema"])
 
 
 @router.get("/schema")
-async def get_openapi_schema(request: Request) -> JSONResponse:
+async def get_openapi_schema(request: Request) -> Response:
     """Get OpenAPI schema for the API.
 
+    The schema is fixed once the app is built, so it is serialized on the first
+    request and the encoded body reused afterwards.
+
     Args:
         request: FastAPI request object
 
     Returns:
-        JSONResponse: OpenAPI schema as JSON
+        Response: OpenAPI schema as JSON
     """
-    return JSONResponse(request.app.openapi())
+    body = getattr(request.app.state, "openapi_body", None)
+    if body is None:
+        body = JSONResponse(request.app.openapi()).body
+        request.app.state.openapi_body = body
+    return Response(content=body, media_type="application/json")
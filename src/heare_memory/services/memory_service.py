@@ -56,11 +56,8 @@ class MemoryService:
             if not await self.file_manager.file_exists(path):
                 raise MemoryNotFoundError(f"Memory node not found: {path}")
 
-            # Read file content
-            content = await self.file_manager.read_file(path)
-
-            # Get file metadata
-            file_metadata = await self.file_manager.get_file_metadata(path)
+            # Read file content; its metadata comes from the same open descriptor
+            content, file_metadata = await self.file_manager.read_file_with_metadata(path)
 
             # Get current git SHA for the file
             try:
@@ -325,11 +322,10 @@ class MemoryService:
             PathValidationError: If the path is invalid
         """
         try:
-            if not await self.file_manager.file_exists(path):
-                raise MemoryNotFoundError(f"Memory node not found: {path}")
-
-            # Get file metadata
+            # A single stat both checks existence and provides the metadata
             file_metadata = await self.file_manager.get_file_metadata(path)
+            if not file_metadata.exists:
+                raise MemoryNotFoundError(f"Memory node not found: {path}")
 
             # Get current git SHA for the file
             try:
@@ -1,12 +1,14 @@
 """Startup checks and service initialization."""
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 from .config import settings
 from .external_tools import tool_checker
 from .git_manager import GitManager
+from .models import EMPTY_DETAILS
 from .search_backend import search_backend
 
 logger = logging.getLogger(__name__)
@@ -28,9 +30,11 @@ class StartupResult:
 class StartupError(Exception):
     """Exception raised when startup checks fail."""
 
-    def __init__(self, message: str, details: dict[str, Any] | None = None):
+    __slots__ = ("details",)
+
+    def __init__(self, message: str, details: Mapping[str, Any] | None = None):
         super().__init__(message)
-        self.details = details or {}
+        self.details = details if details else EMPTY_DETAILS
 
 
 async def run_startup_checks() -> StartupResult:
@@ -76,16 +80,18 @@ async def run_startup_checks() -> StartupResult:
         tools_status.search_backend.available,
     )
 
-    if tools_status.git.available:
-        logger.info("Git version: %s", tools_status.git.version)
-    if tools_status.gh_cli.available:
-        logger.info("GitHub CLI version: %s", tools_status.gh_cli.version)
-    if tools_status.search_backend.available:
-        logger.info(
-            "Search backend: %s (%s)",
-            tools_status.search_backend.name,
-            tools_status.search_backend.version,
-        )
+    # Version probes spawn a subprocess each, so only run them when they are logged
+    if logger.isEnabledFor(logging.INFO):
+        if tools_status.git.available:
+            logger.info("Git version: %s", tool_checker.get_version(tools_status.git))
+        if tools_status.gh_cli.available:
+            logger.info("GitHub CLI version: %s", tool_checker.get_version(tools_status.gh_cli))
+        if tools_status.search_backend.available:
+            logger.info(
+                "Search backend: %s (%s)",
+                tools_status.search_backend.name,
+                tool_checker.get_version(tools_status.search_backend),
+            )
 
     # Fail fast if git is not available
     if not tools_status.git.available:
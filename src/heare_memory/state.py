@@ -4,7 +4,6 @@ import logging
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
-    from .file_manager import FileManager
     from .git_manager import GitManager
 
 logger = logging.getLogger(__name__)
@@ -18,7 +17,6 @@ class ApplicationState:
         self.startup_time: float | None = None
         self.config: dict[str, Any] | None = None
         self.tools_status: dict[str, Any] | None = None
-        self.file_manager: FileManager | None = None
         self.git_manager: GitManager | None = None
 
     def set_startup_time(self, startup_time: float) -> None:
@@ -124,7 +124,7 @@ def mock_readonly_settings(monkeypatch) -> Mock:
     """Mock settings in read-only mode."""
     mock_settings = Mock()
     mock_settings.is_read_only = True
-    monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+    monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
     return mock_settings
 
 
@@ -133,7 +133,7 @@ def mock_writable_settings(monkeypatch) -> Mock:
     """Mock settings in writable mode."""
     mock_settings = Mock()
     mock_settings.is_read_only = False
-    monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+    monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
     return mock_settings
 
 
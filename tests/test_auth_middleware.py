@@ -1,5 +1,6 @@
 """Tests for authentication middleware."""
 
+from dataclasses import FrozenInstanceError, asdict
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,7 +12,12 @@ from src.heare_memory.middleware.auth import (
     get_auth_context,
     require_write_access,
 )
-from src.heare_memory.models.auth import AuthContext, OperationType, ReadOnlyModeError
+from src.heare_memory.models.auth import (
+    AuthContext,
+    AuthenticationError,
+    OperationType,
+    ReadOnlyModeError,
+)
 
 
 class TestAuthenticationMiddleware:
@@ -42,7 +48,9 @@ class TestAuthenticationMiddleware:
         @app.get("/memory/auth-context")
         async def get_auth_context_endpoint(request: Request):
             auth_context = get_auth_context(request)
-            return auth_context.dict() if auth_context else {"error": "No auth context"}
+            if auth_context is None:
+                return {"error": "No auth context"}
+            return {**asdict(auth_context), "timestamp": auth_context.timestamp.isoformat()}
 
         return app
 
@@ -150,8 +158,12 @@ class TestAuthenticationMiddleware:
 
         request_id = response.headers["X-Request-ID"]
         assert len(request_id) > 0
-        # Should be a UUID format (roughly)
-        assert len(request_id.split("-")) == 5
+        # PID, start time and per-process counter, all hex
+        assert len(request_id.split("-")) == 3
+
+        next_id = client_writable_mode.get("/memory/test").headers["X-Request-ID"]
+        assert next_id != request_id
+        assert next_id.rsplit("-", 1)[0] == request_id.rsplit("-", 1)[0]
 
     def test_error_response_format(self, client_readonly_mode):
         """Test that error responses follow the standard format."""
@@ -186,6 +198,60 @@ class TestAuthenticationMiddleware:
 class TestAuthHelperFunctions:
     """Test authentication helper functions."""
 
+    def test_downstream_read_only_error_becomes_403(self):
+        """Test that a ReadOnlyModeError raised by an endpoint is turned into a 403."""
+        app = FastAPI()
+        app.add_middleware(AuthenticationMiddleware)
+
+        @app.get("/memory/guarded")
+        async def guarded(request: Request):
+            raise ReadOnlyModeError(operation="write", path=request.url.path)
+
+        response = TestClient(app).get("/memory/guarded")
+
+        assert response.status_code == 403
+        assert response.json()["error"] == "read_only_mode"
+        assert response.json()["details"]["path"] == "/memory/guarded"
+        assert "X-Request-ID" in response.headers
+
+    @pytest.mark.parametrize("path", ["/memory/notes.md", '/memory/a "b"\\c', "/memory/\u00e9\t"])
+    async def test_read_only_rejection_matches_json_response(self, path):
+        """Test that the pre-serialized rejection body matches the JSONResponse one."""
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        await AuthenticationMiddleware._send_read_only_rejection(path, "req-1", send)
+
+        error = ReadOnlyModeError(operation="write", path=path)
+        expected = AuthenticationMiddleware(Mock())._create_error_response(
+            status_code=403,
+            error_code=error.error_code,
+            message=error.message,
+            details=error.details,
+            request_id="req-1",
+        )
+        assert messages[0]["status"] == 403
+        assert dict(messages[0]["headers"]) == dict(expected.raw_headers)
+        assert messages[1]["body"] == expected.body
+
+    def test_settings_snapshotted_until_reload(self):
+        """Test that auth settings are read once at construction and on reload()."""
+        with patch("src.heare_memory.middleware.auth.settings") as mock_settings:
+            mock_settings.is_read_only = True
+            mock_settings.github_token = None
+            middleware = AuthenticationMiddleware(Mock())
+
+            mock_settings.is_read_only = False
+            mock_settings.github_token = "test_token"  # noqa: S105
+            assert middleware._read_only is True
+            assert middleware._token_configured is False
+
+            middleware.reload()
+            assert middleware._read_only is False
+            assert middleware._token_configured is True
+
     def test_get_auth_context_missing(self):
         """Test getting auth context when not available."""
         mock_request = Mock()
@@ -271,6 +337,11 @@ class TestAuthModels:
         assert context.github_token_configured is False
         assert context.operation_type == OperationType.READ
         assert context.bypass_auth is False  # Default value
+        assert context.timestamp.tzinfo is None
+
+        with pytest.raises(FrozenInstanceError):
+            context.read_only_mode = False
+        assert not hasattr(context, "__dict__")
 
     def test_readonly_mode_error(self):
         """Test ReadOnlyModeError creation."""
@@ -282,6 +353,61 @@ class TestAuthModels:
         assert error.details["path"] == "/memory/test"
         assert error.details["read_only"] is True
 
+    def test_readonly_mode_error_uses_slots(self):
+        """Test that error attributes live in slots rather than an instance dict."""
+        error = ReadOnlyModeError(operation="write", path="/memory/test")
+
+        assert error.error_code == "read_only_mode"
+        assert error.__dict__ == {}
+
+    def test_readonly_mode_error_shared_details(self):
+        """Test that path-less violations share immutable details per operation."""
+        first = ReadOnlyModeError(operation="write")
+        second = ReadOnlyModeError(operation="write")
+
+        assert first.details is second.details
+        assert dict(first.details) == {"read_only": True, "operation": "write"}
+        with pytest.raises(TypeError):
+            first.details["path"] = "/memory/test"
+
+        assert ReadOnlyModeError(operation="delete").details["operation"] == "delete"
+
+    def test_error_without_details_shares_empty_mapping(self):
+        """Test that errors raised without details share one immutable mapping."""
+        first = AuthenticationError("boom")
+        second = AuthenticationError("bang", details={})
+
+        assert first.details is second.details
+        assert dict(first.details) == {}
+        with pytest.raises(TypeError):
+            first.details["key"] = "value"
+
+    def test_readonly_mode_error_message_formatting(self):
+        """Test that the templated message is formatted on access."""
+        error = ReadOnlyModeError(operation="delete")
+
+        expected = "Service is in read-only mode. Configure GITHUB_TOKEN for delete operations."
+        assert error.message == expected
+        assert str(error) == expected
+        assert AuthenticationError("plain message").message == "plain message"
+
+        # Write violations reuse the preformatted message
+        write_error = ReadOnlyModeError(path="/memory/test")
+        assert write_error.message is ReadOnlyModeError(operation="write").message
+        assert write_error.message.endswith("for write operations.")
+
+    def test_default_error_codes(self):
+        """Test error codes derived once per exception class."""
+
+        class TokenExpiredError(AuthenticationError):
+            pass
+
+        assert AuthenticationError("boom").error_code == "authentication_error"
+        assert TokenExpiredError.default_error_code == "token_expired_error"
+        assert TokenExpiredError("expired").error_code == "token_expired_error"
+        assert TokenExpiredError("expired", error_code="custom").error_code == "custom"
+        assert ReadOnlyModeError.default_error_code == "read_only_mode"
+
     def test_operation_type_enum_values(self):
         """Test OperationType enum values."""
         assert OperationType.READ == "read"
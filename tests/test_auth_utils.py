@@ -2,6 +2,7 @@
 
 from src.heare_memory.models.auth import (
     OperationType,
+    classify_request,
     get_operation_type,
     is_public_endpoint,
     is_write_operation,
@@ -85,11 +86,12 @@ class TestAuthenticationUtils:
         assert get_operation_type("GET", "/redoc") == OperationType.SCHEMA
         assert get_operation_type("GET", "/openapi.json") == OperationType.SCHEMA
 
-    def test_get_operation_type_case_insensitive(self):
-        """Test that operation type detection is case insensitive."""
+    def test_get_operation_type_case(self):
+        """Test that methods are case insensitive while paths are case sensitive."""
         assert get_operation_type("get", "/memory/test") == OperationType.READ
         assert get_operation_type("PUT", "/MEMORY/TEST") == OperationType.WRITE
-        assert get_operation_type("GET", "/HEALTH") == OperationType.HEALTH
+        assert get_operation_type("GET", "/HEALTH") == OperationType.READ
+        assert get_operation_type("POST", "/Health") == OperationType.WRITE
 
     def test_endpoint_normalization(self):
         """Test that endpoint paths are properly normalized."""
@@ -99,6 +101,45 @@ class TestAuthenticationUtils:
         assert is_public_endpoint("/health/") is True
         assert is_public_endpoint("//health//") is True
 
-        # Case sensitivity
-        assert is_public_endpoint("/HEALTH") is True
-        assert is_public_endpoint("/Health") is True
+        # Paths are case sensitive, like the routes they guard
+        assert is_public_endpoint("/HEALTH") is False
+        assert is_public_endpoint("/Health") is False
+
+    def test_classify_request_matches_individual_checks(self):
+        """Test that the combined classifier agrees with the single-purpose helpers."""
+        cases = [
+            ("GET", "/memory/test"),
+            ("DELETE", "/memory/test?force=1"),
+            ("OPTIONS", "/health"),
+            ("POST", "/HEALTH/"),
+            ("POST", "/health/"),
+            ("GET", "/docs"),
+            ("PUT", "/"),
+            ("GET", "/health/?verbose=1"),
+        ]
+        for method, path in cases:
+            assert classify_request(method, path) == (
+                get_operation_type(method, path),
+                is_public_endpoint(path),
+            )
+
+        assert classify_request("PUT", "/") == (OperationType.WRITE, True)
+
+    def test_is_public_endpoint_unusual_prefixes(self):
+        """Test that public paths behind extra slashes or bare queries are still found."""
+        assert is_public_endpoint("//health") is True
+        assert is_public_endpoint("/?page=1") is True
+        assert is_public_endpoint("docs") is True
+        assert is_public_endpoint("") is True
+        assert is_public_endpoint("/memory/health") is False
+        assert is_public_endpoint("/hello") is False
+
+    def test_classify_request_is_cached(self):
+        """Test that repeated classifications of the same request hit the cache."""
+        classify_request.cache_clear()
+        classify_request("GET", "/memory/cached")
+        classify_request("GET", "/memory/cached")
+
+        info = classify_request.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
@@ -54,6 +55,32 @@ class TestFileManagerBasicOperations:
         read_content = await file_manager.read_file("test.md")
         assert read_content == content
 
+    @pytest.mark.asyncio
+    async def test_read_file_with_metadata(self, file_manager):
+        """Test reading content and metadata together."""
+        await file_manager.write_file("with-meta.md", "# Café")
+
+        content, metadata = await file_manager.read_file_with_metadata("with-meta.md")
+
+        assert content == "# Café"
+        assert metadata.path == "with-meta.md"
+        assert metadata.exists is True
+        assert metadata.is_directory is False
+        assert metadata.size == len("# Café".encode())
+
+        assert await file_manager.read_file_bytes("with-meta.md") == "# Café".encode()
+
+    @pytest.mark.asyncio
+    async def test_write_metadata_matches_disk(self, file_manager):
+        """Test that metadata returned by a write matches a fresh stat of the file."""
+        written = await file_manager.write_file("stat-check.md", "# Stat\n")
+        on_disk = await file_manager.get_file_metadata("stat-check.md")
+
+        assert written.size == on_disk.size == len(b"# Stat\n")
+        assert written.modified_at == on_disk.modified_at
+        assert written.permissions == on_disk.permissions
+        assert written.is_directory is False
+
     @pytest.mark.asyncio
     async def test_write_nested_file(self, file_manager):
         """Test writing a file in nested directories."""
@@ -107,6 +134,7 @@ class TestFileManagerBasicOperations:
         metadata = await file_manager.get_file_metadata("nonexistent.md")
         assert metadata.exists is False
         assert metadata.size == 0
+        assert metadata.created_at == metadata.modified_at
 
         # Existing file
         await file_manager.write_file("metadata.md", content)
@@ -200,6 +228,28 @@ class TestFileManagerListing:
         assert listing.total_files == 1
         assert listing.files == ["src/code.md"]
 
+        # A file named after the prefix is listed alongside its contents
+        await file_manager.write_file("src.md", "index")
+        listing = await file_manager.list_files(prefix="src")
+        assert listing.files == ["src.md", "src/code.md"]
+
+        # A prefix with no directory yields nothing
+        listing = await file_manager.list_files(prefix="missing")
+        assert listing.total_files == 0
+
+    @pytest.mark.asyncio
+    async def test_list_files_skips_escaping_prefix_sibling(self, file_manager):
+        """Test that a prefix sibling symlinked outside memory root is not listed."""
+        await file_manager.write_file("docs/readme.md", "readme")
+
+        with tempfile.TemporaryDirectory() as outside:
+            secret = Path(outside) / "secret.md"
+            secret.write_text("secret")
+            (file_manager._get_memory_root() / "docs.md").symlink_to(secret)
+
+            listing = await file_manager.list_files(prefix="docs")
+            assert listing.files == ["docs/readme.md"]
+
     @pytest.mark.asyncio
     async def test_list_files_non_recursive(self, file_manager):
         """Test non-recursive file listing."""
@@ -246,6 +296,20 @@ class TestFileManagerConcurrency:
             content = await file_manager.read_file(f"file{i}.md")
             assert content == f"content{i}"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_deletes_same_file(self, file_manager):
+        """Test that exactly one of several concurrent deletes removes the file."""
+        import asyncio
+
+        await file_manager.write_file("contested.md", "content")
+
+        results = await asyncio.gather(
+            *(file_manager.delete_file("contested.md") for _ in range(5))
+        )
+
+        assert results.count(True) == 1
+        assert await file_manager.file_exists("contested.md") is False
+
     @pytest.mark.asyncio
     async def test_atomic_write_operation(self, file_manager):
         """Test that write operations are atomic."""
@@ -364,6 +428,45 @@ class TestFileManagerOperations:
         assert result.success is False
         assert "Content required" in result.error
 
+    @pytest.mark.asyncio
+    async def test_perform_operations_batch(self, file_manager):
+        """Test a batch keeps result order and per-path write/delete order."""
+        await file_manager.write_file("existing.md", "existing")
+
+        operations = [
+            FileOperation(action="write", path="batch.md", content="first"),
+            FileOperation(action="read", path="existing.md"),
+            FileOperation(action="write", path="batch.md", content="second"),
+            FileOperation(action="write", path="other.md", content="other"),
+            FileOperation(action="delete", path="other.md"),
+            FileOperation(action="invalid", path="batch.md"),
+        ]
+        results = await file_manager.perform_operations(operations, concurrency=2)
+
+        assert [r.action for r in results] == [op.action for op in operations]
+        assert [r.success for r in results] == [True, True, True, True, True, False]
+        assert results[1].content == "existing"
+        assert results[4].content == "True"
+        assert await file_manager.read_file("batch.md") == "second"
+        assert await file_manager.file_exists("other.md") is False
+
+    @pytest.mark.asyncio
+    async def test_perform_operations_reads_follow_earlier_writes(self, file_manager):
+        """Test that reads in a batch see earlier changes to the same file."""
+        operations = [
+            FileOperation(action="write", path="seq.md", content="first"),
+            FileOperation(action="read", path="seq.md"),
+            FileOperation(action="write", path="seq", content="second"),
+            FileOperation(action="read", path="seq.md"),
+            FileOperation(action="delete", path="seq.md"),
+            FileOperation(action="exists", path="seq.md"),
+        ]
+        results = await file_manager.perform_operations(operations)
+
+        assert results[1].content == "first"
+        assert results[3].content == "second"
+        assert results[5].content == "False"
+
 
 class TestFileManagerErrorHandling:
     """Test error handling in file manager."""
@@ -390,3 +493,29 @@ class TestFileManagerErrorHandling:
         # The nested directory should be gone, but deep should remain
         # This is hard to test directly, so we'll just ensure no errors occur
         assert await file_manager.file_exists("deep/other.md") is True
+
+    @pytest.mark.asyncio
+    async def test_directory_cleanup_stops_at_non_empty(self, file_manager):
+        """Test that cleanup removes empty directories up to the first non-empty one."""
+        await file_manager.write_file("keep/drop/deeper/file.md", "content")
+        await file_manager.write_file("keep/other.md", "other")
+        root = file_manager._get_memory_root()
+
+        await file_manager.delete_file("keep/drop/deeper/file.md")
+
+        assert not (root / "keep" / "drop").exists()
+        assert (root / "keep" / "other.md").is_file()
+
+    @pytest.mark.asyncio
+    async def test_top_level_delete_skips_cleanup(self, file_manager):
+        """Test that deleting a top-level file does not walk for empty directories."""
+        await file_manager.write_file("top.md", "content")
+        await file_manager.write_file("nested/file.md", "content")
+
+        cleanup = file_manager._cleanup_empty_directories
+        with patch.object(file_manager, "_cleanup_empty_directories", wraps=cleanup) as mocked:
+            assert await file_manager.delete_file("top.md") is True
+            mocked.assert_not_called()
+
+            assert await file_manager.delete_file("nested/file.md") is True
+            mocked.assert_called_once()
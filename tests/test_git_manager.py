@@ -1,11 +1,14 @@
 """Tests for GitManager."""
 
+import asyncio
 import tempfile
+import threading
 from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from heare_memory.git_manager import GitManager
+from heare_memory.git_manager import GitManager, _parse_porcelain_status
 from heare_memory.models.git import GitBatchOperation, GitOperation, GitOperationType
 
 
@@ -147,3 +150,278 @@ class TestGitManager:
         assert (git_manager.repository_path / "file1.md").read_text() == "Updated content"
         assert not (git_manager.repository_path / "file2.md").exists()
         assert (git_manager.repository_path / "file3.md").read_text() == "New file content"
+
+    async def test_get_file_sha_uses_cache(self, git_manager):
+        """Test that file SHAs come from commits made here without re-querying git."""
+        first = await git_manager.commit_file("first.md", "# First")
+        second = await git_manager.commit_file("second.md", "# Second")
+
+        with patch.object(type(git_manager.repo), "iter_commits") as mock_iter:
+            assert await git_manager.get_file_sha("first.md") == first.commit_sha
+            assert await git_manager.get_file_sha("second.md") == second.commit_sha
+            mock_iter.assert_not_called()
+
+        # Uncached paths fall back to git history
+        assert await git_manager.get_file_sha("untracked.md") is None
+
+    async def test_concurrent_changes_share_one_commit(self, git_manager):
+        """Test that changes arriving together are coalesced into a single commit."""
+        await git_manager.commit_file("existing.md", "# Existing")
+        commits_before = len(list(git_manager.repo.iter_commits()))
+
+        results = await asyncio.gather(
+            git_manager.commit_file("a.md", "# A"),
+            git_manager.commit_file("b.md", "# B"),
+            git_manager.delete_file("existing.md"),
+            git_manager.delete_file("missing.md"),
+        )
+
+        assert all(result.success for result in results)
+        assert len(list(git_manager.repo.iter_commits())) == commits_before + 1
+        assert results[0].commit_sha == results[1].commit_sha == results[2].commit_sha
+        assert [result.files_changed for result in results] == [
+            ["a.md"],
+            ["b.md"],
+            ["existing.md"],
+            [],
+        ]
+        assert results[3].commit_sha is None
+        assert git_manager.repo.head.commit.message.startswith("Apply 3 memory changes")
+
+    async def test_failed_change_does_not_fail_its_batch(self, git_manager):
+        """Test that one failing change leaves the rest of its batch committed."""
+        # Writing over a directory fails for that change only
+        (git_manager.repository_path / "blocked.md").mkdir()
+
+        results = await asyncio.gather(
+            git_manager.commit_file("a.md", "# A"),
+            git_manager.commit_file("blocked.md", "# Blocked"),
+            git_manager.commit_file("b.md", "# B"),
+        )
+
+        assert results[0].success
+        assert results[2].success
+        assert results[0].commit_sha == results[2].commit_sha
+        assert not results[1].success
+        assert "blocked.md" in results[1].error_message
+        assert results[1].files_changed == []
+
+        tree = git_manager.repo.head.commit.tree
+        assert "a.md" in tree
+        assert "b.md" in tree
+        assert "blocked.md" not in tree
+
+    async def test_batch_commit_write_then_delete(self, git_manager):
+        """Test that a path written and deleted in one batch is left untracked."""
+        await git_manager.commit_file("tracked.md", "# Tracked")
+
+        operations = [
+            GitOperation(
+                operation_type=GitOperationType.CREATE,
+                file_path="scratch.md",
+                content="Temporary",
+            ),
+            GitOperation(operation_type=GitOperationType.DELETE, file_path="scratch.md"),
+            GitOperation(operation_type=GitOperationType.DELETE, file_path="tracked.md"),
+        ]
+        batch = GitBatchOperation(operations=operations, commit_message="Scratch batch")
+
+        result = await git_manager.batch_commit(batch)
+
+        assert result.success
+        assert ("scratch.md", 0) not in git_manager.repo.index.entries
+        assert ("tracked.md", 0) not in git_manager.repo.index.entries
+        assert not git_manager.repo.is_dirty(untracked_files=True)
+
+    async def test_git_calls_run_off_event_loop(self, git_manager):
+        """Test that blocking GitPython work runs on the dedicated git thread."""
+        threads = []
+        remember = git_manager._remember_commit
+
+        def record_thread(*args):
+            threads.append(threading.current_thread().name)
+            remember(*args)
+
+        with patch.object(git_manager, "_remember_commit", side_effect=record_thread):
+            result = await git_manager.commit_file("threaded.md", "# Threaded")
+
+        assert result.success
+        assert threads and threads[0].startswith("git")
+        assert threads[0] != threading.current_thread().name
+
+    async def test_execute_push_keeps_token_out_of_url(self, git_manager):
+        """Test that push passes the token through the environment, not the command line."""
+        proc = AsyncMock()
+        proc.communicate.return_value = (b"", b"")
+        proc.returncode = 0
+
+        with (
+            patch("heare_memory.git_manager.settings") as mock_settings,
+            patch("asyncio.create_subprocess_exec", return_value=proc) as mock_exec,
+        ):
+            mock_settings.github_token = "secret-token"  # noqa: S105
+            mock_settings.git_remote_url = "https://github.com/example/memory.git"
+
+            await git_manager._execute_push()
+
+        args = mock_exec.call_args.args
+        env = mock_exec.call_args.kwargs["env"]
+        assert args == ("git", "push", "https://github.com/example/memory.git", "HEAD")
+        assert env["GITHUB_TOKEN"] == "secret-token"  # noqa: S105
+        assert env["GIT_TERMINAL_PROMPT"] == "0"
+
+    async def test_concurrent_pushes_share_one_push(self, git_manager):
+        """Test that concurrent push requests result in a single git push."""
+        await git_manager.commit_file("pushed.md", "# Pushed")
+
+        with (
+            patch("heare_memory.git_manager.settings") as mock_settings,
+            patch.object(git_manager, "_execute_push", new_callable=AsyncMock) as mock_push,
+        ):
+            mock_settings.github_token = "token"  # noqa: S105
+            mock_settings.git_remote_url = "https://github.com/example/memory.git"
+
+            results = await asyncio.gather(*(git_manager.push_changes() for _ in range(5)))
+
+        assert all(result.success for result in results)
+        mock_push.assert_awaited_once()
+        assert git_manager._unpushed_commits == 0
+
+    async def test_repository_status_is_cached_until_commit(self, git_manager):
+        """Test that status is reused between commits and refreshed after one."""
+        await git_manager.commit_file("first.md", "# First")
+
+        status = await git_manager.get_repository_status()
+        assert await git_manager.get_repository_status() is status
+        assert status.last_commit.files_changed == []
+
+        # Asking for the commit's files refreshes a status read without them
+        detailed = await git_manager.get_repository_status(include_files=True)
+        assert detailed.last_commit.files_changed == ["first.md"]
+        assert await git_manager.get_repository_status() is detailed
+
+        await git_manager.commit_file("second.md", "# Second")
+
+        refreshed = await git_manager.get_repository_status(include_files=True)
+        assert refreshed is not detailed
+        assert refreshed.last_commit.files_changed == ["second.md"]
+
+    async def test_committed_blob_matches_content(self, git_manager):
+        """Test that blobs staged from memory match the working-tree file."""
+        content = "# Blob\n\nUnicode: café\n"
+        await git_manager.commit_file("blob.md", content)
+
+        blob = git_manager.repo.head.commit.tree / "blob.md"
+        assert blob.data_stream.read() == content.encode("utf-8")
+        assert (git_manager.repository_path / "blob.md").read_text(encoding="utf-8") == content
+        assert not git_manager.repo.is_dirty()
+
+    async def test_get_file_sha_never_reopens_repository(self, git_manager, temp_repo_path):
+        """Test that SHA lookups use the managed handle and reopening is explicit."""
+        result = await git_manager.commit_file("kept.md", "# Kept")
+
+        with patch("heare_memory.git_manager.Repo") as mock_repo:
+            assert await GitManager(temp_repo_path).get_file_sha("kept.md") is None
+            assert await git_manager.get_file_sha("kept.md") == result.commit_sha
+            mock_repo.assert_not_called()
+
+        handle = git_manager.repo
+        await git_manager._reopen_repo()
+        assert git_manager.repo is not handle
+        assert git_manager._file_shas == {}
+        assert await git_manager.get_file_sha("kept.md") == result.commit_sha
+
+    async def test_repository_status_reports_working_tree_changes(self, git_manager):
+        """Test that modified and untracked files are detected from one status walk."""
+        await git_manager.commit_file("tracked.md", "# Tracked")
+
+        (git_manager.repository_path / "untracked.md").write_text("# New")
+        git_manager._repo_version += 1
+        status = await git_manager.get_repository_status()
+        assert status.is_clean
+        assert status.has_uncommitted_changes
+
+        (git_manager.repository_path / "tracked.md").write_text("# Changed")
+        git_manager._repo_version += 1
+        status = await git_manager.get_repository_status()
+        assert not status.is_clean
+        assert status.has_uncommitted_changes
+
+    async def test_batch_commit_syncs_each_directory_once(self, git_manager):
+        """Test that a batch creates and flushes each parent directory only once."""
+        operations = [
+            GitOperation(
+                operation_type=GitOperationType.CREATE,
+                file_path=f"shared/file{i}.md",
+                content=f"Content {i}",
+            )
+            for i in range(5)
+        ]
+        batch = GitBatchOperation(operations=operations, commit_message="Shared directory")
+
+        with patch("heare_memory.git_manager.fsync_directory") as mock_fsync:
+            result = await git_manager.batch_commit(batch)
+
+        assert result.success
+        mock_fsync.assert_called_once_with(git_manager.repository_path / "shared")
+
+    async def test_batch_commit_stages_in_bulk(self, git_manager):
+        """Test that a batch stages additions and removals with one call each."""
+        await git_manager.commit_file("old1.md", "Old 1")
+        await git_manager.commit_file("old2.md", "Old 2")
+
+        operations = [
+            GitOperation(
+                operation_type=GitOperationType.CREATE, file_path=f"new{i}.md", content=f"New {i}"
+            )
+            for i in range(3)
+        ] + [
+            GitOperation(operation_type=GitOperationType.DELETE, file_path="old1.md"),
+            GitOperation(operation_type=GitOperationType.DELETE, file_path="old2.md"),
+        ]
+        batch = GitBatchOperation(operations=operations, commit_message="Bulk staging")
+
+        index_cls = type(git_manager.repo.index)
+        with (
+            patch.object(index_cls, "add", autospec=True, side_effect=index_cls.add) as mock_add,
+            patch.object(
+                index_cls, "remove", autospec=True, side_effect=index_cls.remove
+            ) as mock_remove,
+        ):
+            result = await git_manager.batch_commit(batch)
+
+        assert result.success
+        assert len(result.files_changed) == 5
+        mock_add.assert_called_once()
+        mock_remove.assert_called_once()
+        assert len(mock_add.call_args.args[1]) == 3
+        assert sorted(mock_remove.call_args.args[1]) == ["old1.md", "old2.md"]
+
+    async def test_commits_during_push_stay_pending(self, git_manager):
+        """Test that only commits made before a push starts are cleared by it."""
+        await git_manager.commit_file("before.md", "# Before")
+
+        async def commit_during_push():
+            await git_manager.commit_file("during.md", "# During")
+
+        with (
+            patch("heare_memory.git_manager.settings") as mock_settings,
+            patch.object(git_manager, "_execute_push", side_effect=commit_during_push),
+        ):
+            mock_settings.github_token = "token"  # noqa: S105
+            mock_settings.git_remote_url = "https://github.com/example/memory.git"
+
+            result = await git_manager.push_changes()
+
+        assert result.success
+        assert git_manager._unpushed_commits == 1
+
+
+def test_parse_porcelain_status():
+    """Test reducing NUL-separated porcelain output to dirty/untracked flags."""
+    assert _parse_porcelain_status(b"") == (False, False)
+    assert _parse_porcelain_status(b"?? new.md\0") == (False, True)
+    assert _parse_porcelain_status(b" M changed.md\0") == (True, False)
+    # The rename's source record must not be mistaken for an untracked entry
+    assert _parse_porcelain_status(b"R  renamed.md\0?? odd-name.md\0") == (True, False)
+    assert _parse_porcelain_status(b"D  gone.md\0?? new.md\0") == (True, True)
@@ -1,9 +1,12 @@
 """Basic tests for the main application."""
 
+from unittest.mock import Mock, patch
+
 import pytest
 from fastapi.testclient import TestClient
 
 from heare_memory.main import create_app
+from heare_memory.services.memory_service import MemoryNotFoundError
 
 
 @pytest.fixture
@@ -32,6 +35,43 @@ def test_app_creation() -> None:
     assert app.title == "Heare Memory Global Service"
 
 
+def test_dependencies_created_lazily_without_lifespan() -> None:
+    """Test that requests work without startup and reuse the lazily built singletons."""
+    app = create_app()
+    client = TestClient(app)  # Not entered, so the lifespan does not run
+
+    response = client.get("/memory/missing-node")
+    assert response.status_code == 404
+
+    memory_service = app.state.memory_service
+    assert memory_service.file_manager is app.state.file_manager
+    assert memory_service.git_manager is app.state.git_manager
+
+    client.get("/memory/missing-node")
+    assert app.state.memory_service is memory_service
+
+
+def test_dependencies_use_lifespan_singletons() -> None:
+    """Test that requests use the instances built during application startup."""
+    app = create_app()
+    startup_result = Mock(git_manager=Mock(), warnings=None)
+
+    with (
+        patch("heare_memory.main.run_startup_checks", return_value=startup_result),
+        TestClient(app) as client,
+    ):
+        memory_service = app.state.memory_service
+        assert app.state.git_manager is startup_result.git_manager
+
+        with patch.object(
+            memory_service, "get_memory_node", side_effect=MemoryNotFoundError("missing")
+        ) as mock_get:
+            response = client.get("/memory/missing-node")
+
+    assert response.status_code == 404
+    mock_get.assert_called_once()
+
+
 def test_openapi_schema(client: TestClient) -> None:
     """Test that OpenAPI docs are accessible."""
     response = client.get("/docs")
@@ -46,6 +86,10 @@ def test_schema_endpoint(client: TestClient) -> None:
     assert "openapi" in schema
     assert "info" in schema
 
+    # The encoded schema is reused for later requests
+    assert client.get("/schema").content == response.content
+    assert client.app.state.openapi_body == response.content
+
 
 def test_memory_endpoints_exist(client: TestClient) -> None:
     """Test that memory endpoints are accessible (even if not implemented)."""
@@ -61,3 +105,40 @@ def test_memory_endpoints_exist(client: TestClient) -> None:
 
     response = client.get("/memory/")
     assert response.status_code == 501
+
+
+def test_settings_are_loaded_lazily():
+    """Test that the settings proxy builds Settings on first attribute access."""
+    from heare_memory.config import Settings, _LazySettings
+
+    with patch("heare_memory.config.Settings", wraps=Settings) as mock_settings_cls:
+        lazy = _LazySettings()
+        mock_settings_cls.assert_not_called()
+
+        assert lazy.service_port == 8000
+        assert lazy.is_read_only == (lazy.github_token is None)
+        mock_settings_cls.assert_called_once()
+
+
+def test_error_handler_reuses_auth_request_id(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that unhandled errors report the request ID assigned by authentication."""
+    app = create_app()
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    with patch("heare_memory.middleware.error_handler.generate_request_id") as mock_generate:
+        response = TestClient(app, raise_server_exceptions=False).get("/boom?verbose=1")
+
+    assert response.status_code == 500
+    assert response.json() == {
+        "error": "internal_server_error",
+        "message": "An internal server error occurred",
+        "details": {},
+    }
+    assert response.headers["content-type"] == "application/json"
+    assert len(response.headers["X-Request-ID"].split("-")) == 3
+    mock_generate.assert_not_called()
+    # Only the path is logged, not the full URL
+    assert caplog.records[-1].getMessage().endswith("GET /boom")
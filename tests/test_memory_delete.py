@@ -29,7 +29,7 @@ class TestDeleteMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service
         mock_service = AsyncMock()
@@ -58,7 +58,7 @@ class TestDeleteMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service
         mock_service = AsyncMock()
@@ -91,7 +91,7 @@ class TestDeleteMemoryNode:
         # Mock settings to be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = True
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service (won't be called)
         mock_service = AsyncMock()
@@ -118,7 +118,7 @@ class TestDeleteMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock path sanitization to raise validation error
         def mock_sanitize_path(path):
@@ -148,7 +148,7 @@ class TestDeleteMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service to raise an error
         mock_service = AsyncMock()
@@ -173,7 +173,7 @@ class TestDeleteMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service to raise unexpected error
         mock_service = AsyncMock()
@@ -198,7 +198,7 @@ class TestDeleteMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service
         mock_service = AsyncMock()
@@ -231,7 +231,7 @@ class TestDeleteMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service - first call succeeds, subsequent calls return False
         mock_service = AsyncMock()
@@ -266,7 +266,7 @@ class TestDeleteMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service
         mock_service = AsyncMock()
@@ -177,7 +177,7 @@ class TestPutMemoryNode:
         # Mock settings to be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = True
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service (won't be called)
         mock_service = AsyncMock()
@@ -210,7 +210,7 @@ class TestPutMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service (won't be called due to path validation)
         mock_service = AsyncMock()
@@ -234,7 +234,7 @@ class TestPutMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Mock the memory service to raise an error
         mock_service = AsyncMock()
@@ -259,7 +259,7 @@ class TestPutMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # This test simulates a case where content encoding fails
         # In practice, FastAPI/Pydantic would catch most of these earlier
@@ -291,7 +291,7 @@ class TestPutMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Create test data
         now = datetime.now()
@@ -340,7 +340,7 @@ class TestPutMemoryNode:
         # Mock settings to not be read-only
         mock_settings = Mock()
         mock_settings.is_read_only = False
-        monkeypatch.setattr("heare_memory.config.settings", mock_settings)
+        monkeypatch.setattr("heare_memory.routers.memory.settings", mock_settings)
 
         # Create test data with specific values for header testing
         test_datetime = datetime(2024, 1, 15, 14, 30, 45)
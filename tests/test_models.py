@@ -6,7 +6,7 @@ from datetime import datetime
 import pytest
 from pydantic import ValidationError
 
-from heare_memory.models.file_metadata import FileMetadata
+from heare_memory.models.file_metadata import DirectoryListing, FileMetadata
 from heare_memory.models.memory import (
     MemoryNode,
     MemoryNodeMetadata,
@@ -168,6 +168,26 @@ class TestMemoryNode:
 
         assert node.line_count == 3
 
+    def test_lines_follow_content(self):
+        """Test that cached lines are reused and refreshed when content changes."""
+        metadata = MemoryNodeMetadata(
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            size=100,
+            sha="abc123",
+        )
+
+        node = MemoryNode(path="multiline.md", content="alpha\nbeta\ngamma", metadata=metadata)
+
+        assert node.line_count == 3
+        assert node._lines() is node._lines()
+        assert node.find_text("beta") == [2]
+
+        node.content = "beta\nalpha"
+        assert node.line_count == 2
+        assert node.find_text("beta") == [1]
+        assert "line_count" in node.model_dump()
+
     def test_is_empty(self):
         """Test empty content detection."""
         metadata = MemoryNodeMetadata(
@@ -248,6 +268,12 @@ class TestMemoryNode:
         no_matches = node.find_text("nonexistent")
         assert no_matches == []
 
+        # Lines are reported once, matches never span lines, and any line break counts
+        node.content = "test test\r\nx\rtest\n\ntest"
+        assert node.find_text("test") == [1, 3, 5]
+        assert node.find_text("test\nx") == []
+        assert node.find_text("") == [1, 2, 3, 4, 5]
+
 
 class TestRequestModels:
     """Test request models."""
@@ -367,6 +393,12 @@ class TestRequestModels:
         custom_request = BatchRequest(operations=operations, commit_message="Custom message")
         assert custom_request.commit_message == "Custom message"
 
+        # Multi-line commit messages are allowed, other control characters are not
+        multiline = BatchRequest(operations=operations, commit_message="Summary\n\n\tBody\r")
+        assert multiline.commit_message == "Summary\n\n\tBody"
+        with pytest.raises(ValidationError):
+            BatchRequest(operations=operations, commit_message="Bad\x07message")
+
         # Empty operations
         with pytest.raises(ValidationError):
             BatchRequest(operations=[])
@@ -493,6 +525,27 @@ class TestResponseModels:
         assert response_with_results.has_results is True
 
 
+class TestDirectoryListing:
+    """Test DirectoryListing model."""
+
+    def test_from_paths(self):
+        """Test that parent directories are collected once, excluding the listed one."""
+        listing = DirectoryListing.from_paths(
+            "notes",
+            ["notes/b.md", "notes/2024/jan/a.md", "notes/2024/feb.md", "notes/2024/jan/b.md"],
+        )
+
+        assert listing.files == [
+            "notes/2024/feb.md",
+            "notes/2024/jan/a.md",
+            "notes/2024/jan/b.md",
+            "notes/b.md",
+        ]
+        assert listing.directories == ["notes/2024", "notes/2024/jan"]
+        assert listing.total_files == 4
+        assert listing.total_directories == 2
+
+
 class TestModelIntegration:
     """Test model integration and edge cases."""
 
@@ -14,8 +14,10 @@ from heare_memory.path_utils import (
     is_path_within_prefix,
     list_directory_paths,
     resolve_memory_path,
+    resolve_sanitized_path,
     sanitize_path,
     validate_path,
+    validate_prefix,
 )
 
 
@@ -67,6 +69,24 @@ class TestPathValidation:
                 validate_path(name)
             assert "reserved name" in str(exc_info.value)
 
+    def test_validate_prefix(self):
+        """Test directory prefix validation without the .md requirement."""
+        for prefix in ["docs", "deep/nested/folder", "with.dots"]:
+            assert validate_prefix(prefix) is True
+
+        invalid_cases = [
+            ("", "Path cannot be empty"),
+            ("/absolute", "Path must be relative"),
+            ("docs/../escape", "Path contains dangerous pattern"),
+            ("docs/.", "Path contains reserved segment"),
+            ("docs/CON", "Path contains reserved name"),
+        ]
+
+        for prefix, expected_error in invalid_cases:
+            with pytest.raises(PathValidationError) as exc_info:
+                validate_prefix(prefix)
+            assert expected_error in str(exc_info.value)
+
 
 class TestPathSanitization:
     """Test path sanitization functionality."""
@@ -155,6 +175,46 @@ class TestPathResolution:
             finally:
                 heare_memory.path_utils.settings = original_settings
 
+    def test_resolve_sanitized_path(self):
+        """Test cached sanitize-and-resolve follows the configured memory root."""
+        import heare_memory.path_utils
+
+        original_settings = heare_memory.path_utils.settings
+        try:
+            for _ in range(2):
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    heare_memory.path_utils.settings = Settings(memory_root=Path(temp_dir))
+
+                    validated, full_path = resolve_sanitized_path("folder\\note")
+                    assert validated == "folder/note.md"
+                    assert full_path == Path(temp_dir).resolve() / "folder" / "note.md"
+                    assert resolve_sanitized_path("folder\\note") == (validated, full_path)
+
+                    with pytest.raises(PathValidationError):
+                        resolve_sanitized_path("../escape.md")
+        finally:
+            heare_memory.path_utils.settings = original_settings
+
+    def test_resolve_sanitized_path_rechecks_symlinks(self):
+        """Test that a directory swapped for an escaping symlink is rejected after caching."""
+        import heare_memory.path_utils
+
+        original_settings = heare_memory.path_utils.settings
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryDirectory() as other:
+                root = Path(temp_dir)
+                heare_memory.path_utils.settings = Settings(memory_root=root)
+
+                (root / "notes").mkdir()
+                assert resolve_sanitized_path("notes/x.md")[0] == "notes/x.md"
+
+                (root / "notes").rmdir()
+                (root / "notes").symlink_to(other, target_is_directory=True)
+                with pytest.raises(PathValidationError):
+                    resolve_sanitized_path("notes/x.md")
+        finally:
+            heare_memory.path_utils.settings = original_settings
+
     def test_get_relative_path(self):
         """Test getting relative path from absolute path."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -258,6 +318,32 @@ class TestPathUtilities:
                 expected_folder = ["folder/sub/test3.md", "folder/test2.md"]
                 assert sorted(folder_paths) == sorted(expected_folder)
 
+                # Directories outside memory root are never walked
+                assert list_directory_paths("..") == []
+
+            finally:
+                heare_memory.path_utils.settings = original_settings
+
+    def test_list_directory_paths_skips_escaping_symlinks(self):
+        """Test that symlinks pointing outside memory root are never listed."""
+        with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryDirectory() as outside:
+            temp_settings = Settings(memory_root=Path(temp_dir))
+
+            import heare_memory.path_utils
+
+            original_settings = heare_memory.path_utils.settings
+            heare_memory.path_utils.settings = temp_settings
+
+            try:
+                (Path(outside) / "secret.md").write_text("secret")
+                (Path(temp_dir) / "test1.md").write_text("content1")
+                (Path(temp_dir) / "linked_dir").symlink_to(outside, target_is_directory=True)
+                (Path(temp_dir) / "linked.md").symlink_to(Path(outside) / "secret.md")
+                (Path(temp_dir) / "alias.md").symlink_to(Path(temp_dir) / "test1.md")
+
+                assert list_directory_paths() == ["alias.md", "test1.md"]
+                assert list_directory_paths("linked_dir") == []
+
             finally:
                 heare_memory.path_utils.settings = original_settings
 
@@ -1,6 +1,7 @@
 """Tests for startup checks."""
 
 import tempfile
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -23,13 +24,18 @@ class TestExternalToolChecker:
         ):
             # Mock successful git version command
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "git version 2.34.1"
+            mock_run.return_value.stdout = b"git version 2.34.1"
 
             result = checker.check_git()
 
             assert result.available
             assert result.name == "git"
-            assert "git version 2.34.1" in result.version
+            mock_run.assert_not_called()
+
+            # Version is probed lazily, once
+            assert "git version 2.34.1" in checker.get_version(result)
+            assert "git version 2.34.1" in checker.get_version(result)
+            assert mock_run.call_count == 1
 
     def test_check_git_not_available(self):
         """Test git availability check when git is not available."""
@@ -50,13 +56,13 @@ class TestExternalToolChecker:
         with patch("shutil.which", return_value="/usr/bin/gh"), patch("subprocess.run") as mock_run:
             # Mock successful gh version command
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "gh version 2.4.0"
+            mock_run.return_value.stdout = b"gh version 2.4.0"
 
             result = checker.check_gh_cli()
 
             assert result.available
             assert result.name == "gh"
-            assert "gh version 2.4.0" in result.version
+            assert "gh version 2.4.0" in checker.get_version(result)
 
     def test_check_search_backend_ripgrep(self):
         """Test search backend check when ripgrep is available."""
@@ -66,12 +72,16 @@ class TestExternalToolChecker:
             # Mock ripgrep available
             mock_which.side_effect = lambda cmd: "/usr/bin/rg" if cmd == "rg" else None
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "ripgrep 13.0.0"
+            mock_run.return_value.stdout = b"ripgrep 13.0.0"
 
             result = checker.check_search_backend()
 
             assert result.available
             assert result.name == "ripgrep"
+            mock_run.assert_not_called()
+
+            assert checker.get_search_backend_version() == "ripgrep 13.0.0"
+            assert mock_run.call_args.args[0] == ["rg", "--version"]
 
     def test_check_search_backend_grep_fallback(self):
         """Test search backend check with grep fallback."""
@@ -88,7 +98,7 @@ class TestExternalToolChecker:
 
             mock_which.side_effect = which_side_effect
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "grep (GNU grep) 3.7"
+            mock_run.return_value.stdout = b"grep (GNU grep) 3.7"
 
             result = checker.check_search_backend()
 
@@ -116,6 +126,53 @@ class TestExternalToolChecker:
             assert status.gh_cli.available
             assert status.search_backend.available
 
+    def test_get_version_unavailable_tool(self):
+        """Test that no version probe runs for unavailable tools."""
+        checker = ExternalToolChecker()
+
+        with patch("subprocess.run") as mock_run:
+            assert checker.get_version(ToolCheck("gh", False)) is None
+            mock_run.assert_not_called()
+
+    def test_get_version_probe_failure(self):
+        """Test that a failing version probe yields no version."""
+        checker = ExternalToolChecker()
+
+        with patch("subprocess.run", side_effect=OSError("exec failed")):
+            assert checker.get_version(ToolCheck("git", True)) is None
+
+    def test_check_results_are_cached(self):
+        """Test that repeated checks reuse cached results until invalidated."""
+        checker = ExternalToolChecker()
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/git") as mock_which,
+            patch("subprocess.run") as mock_run,
+        ):
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = b"git version 2.34.1"
+
+            first = checker.check_git()
+            second = checker.check_git()
+            assert first is second
+            assert mock_which.call_count == 1
+
+            status = checker.check_all_tools()
+            assert checker.check_all_tools() is status
+            assert status.git is first
+
+            checker.invalidate()
+            assert checker.check_git() is not first
+            assert mock_which.call_count > 1
+
+    def test_tool_results_are_immutable(self):
+        """Test that cached tool results cannot be mutated by callers."""
+        check = ToolCheck("git", True)
+
+        with pytest.raises(FrozenInstanceError):
+            check.available = False
+        assert not hasattr(check, "__dict__")
+
     def test_get_search_backend_name(self):
         """Test getting search backend name."""
         checker = ExternalToolChecker()
@@ -170,6 +227,28 @@ class TestStartupChecks:
             assert result.git_manager is not None
             assert result.search_backend == "ripgrep"
 
+    async def test_startup_checks_skip_version_probes_when_not_logged(self, temp_settings):
+        """Test that tool versions are not probed when info logging is disabled."""
+        with (
+            patch("heare_memory.startup.tool_checker") as mock_checker,
+            patch("heare_memory.startup.GitManager") as mock_git_manager,
+            patch("heare_memory.startup.logger") as mock_logger,
+        ):
+            mock_checker.check_all_tools.return_value = MagicMock(
+                git=ToolCheck("git", True),
+                gh_cli=ToolCheck("gh", True),
+                search_backend=ToolCheck("ripgrep", True),
+                all_required_available=True,
+            )
+            mock_checker.get_search_backend_name.return_value = "ripgrep"
+            mock_git_manager.return_value = AsyncMock()
+            mock_logger.isEnabledFor.return_value = False
+
+            result = await run_startup_checks()
+
+            assert result.success
+            mock_checker.get_version.assert_not_called()
+
     async def test_startup_checks_git_not_available(self, temp_settings):
         """Test startup checks when git is not available."""
         with patch("heare_memory.startup.tool_checker") as mock_checker: